@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================#
+#                 PeduliGiziBalita - API-ONLY ENTRY POINT (ASGI)               #
+#==============================================================================#
+
+Replika khusus API: endpoint JSON yang sama dengan app.py (perpustakaan,
+kejar tumbuh, analisis & roster, trace referensi kurva SD) tanpa mengimpor
+Gradio, matplotlib, reportlab, pandas maupun membangun UI. Hanya numpy,
+pygrowup dan FastAPI, sehingga start jauh lebih cepat & memori jauh lebih
+kecil daripada app:app.
+
+Perbedaan dengan app:app:
+  - /api/kejar-tumbuh/analyze mengembalikan analisis HTML saja
+    (plot_path & output_profile null); grafik ada di app:app
+  - tanpa UI Gradio, /outputs, PDF/CSV, grafik server, share card & jobs
+
+RUN: uvicorn api:app --host 0.0.0.0 --port $PORT
+     gunicorn api:app -c gunicorn.conf.py
+"""
+
+import gc
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.cors import CORSMiddleware
+
+from config import APP_TITLE, APP_DESCRIPTION
+from modules.anthropometry import calc, warm_lms_rows
+from modules.growth_curves import shared_cache, warm_growth_curves
+from modules.api import build_api_router, request_validation_error_handler
+from modules.cpu_executor import cpu_executor
+from modules.startup import startup_report
+
+API_VERSION = "3.2.2"
+
+app = FastAPI(
+    title=f"{APP_TITLE} API",
+    description=APP_DESCRIPTION,
+    version=API_VERSION,
+    docs_url="/api/docs",
+    redoc_url="/api/redoc",
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+app.include_router(build_api_router())
+app.add_exception_handler(RequestValidationError, request_validation_error_handler)
+
+
+@app.on_event("shutdown")
+async def _stop_cpu_executor():
+    cpu_executor.shutdown()
+
+
+@app.get("/health")
+async def health_check():
+    """API health check endpoint"""
+    return {
+        "status": "healthy",
+        "version": API_VERSION,
+        "mode": "api-only",
+        "timestamp": datetime.now().isoformat(),
+        "calculator_status": "operational" if calc else "unavailable",
+        "endpoints": {
+            "api_docs": "/api/docs",
+            "health": "/health",
+            "metrics": "/api/metrics",
+            "analyze": "/api/analyze",
+            "analyze_batch": "/api/analyze/batch",
+            "library": "/api/library",
+            "kejar_tumbuh": "/api/kejar-tumbuh/analyze",
+            "reference_curves": "/api/charts/reference/{indicator}",
+        },
+    }
+
+
+@app.get("/api/metrics")
+async def runtime_metrics():
+    """Metrik runtime (shared cache, antrean cpu_executor, langkah startup) untuk monitoring"""
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "shared_cache": shared_cache.stats() if shared_cache else None,
+        "cpu_executor": cpu_executor.stats(),
+        "startup": startup_report(),
+    }
+
+
+def warm_immutable_state(freeze: bool = False) -> Dict[str, Any]:
+    """
+    Bangun state read-only API (kurva SD, baris LMS) sebelum request pertama
+
+    Padanan app.warm_immutable_state untuk gunicorn.conf.py (preload_app):
+    dengan freeze=True objeknya dipindah ke generasi permanen gc.freeze()
+    sehingga dibagi copy-on-write antar worker.
+
+    Args:
+        freeze: gc.collect() lalu gc.freeze() setelah warm-up
+
+    Returns:
+        Ringkasan warm-up (durasi, jumlah objek beku)
+    """
+    started = time.time()
+    warm_growth_curves()
+    lms_rows = warm_lms_rows()
+
+    frozen = None
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        frozen = gc.get_freeze_count()
+    return {
+        "duration_s": round(time.time() - started, 2),
+        "lms_rows": lms_rows,
+        "frozen_objects": frozen,
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 8000)),
+        log_level="info",
+        access_log=True,
+    )
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#          AnthroHPK - BENCHMARK: POST /api/analyze (JSON tanpa grafik)
+#==============================================================================
+
+Mengukur jalur analisis ringan:
+  - pygrowup : lima z-score lewat pygrowup (aritmetika Decimal)
+  - core     : analyze_anthropometry (fast path LMS float + persentil, klasifikasi)
+  - endpoint : POST /api/analyze lewat TestClient pada api:app (validasi
+               Pydantic + JSON, tanpa jaringan)
+
+--verify membandingkan lms_zscore dengan pygrowup untuk setiap indeks
+(termasuk input di luar tabel) dan gagal jika ada selisih.
+
+RUN: python benchmarks/analyze_api.py [--n 2000] [--verify]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import api
+    from modules import anthropometry as anthro
+
+from fastapi.testclient import TestClient
+
+
+def _random_body(rng: random.Random) -> dict:
+    return {
+        "sex": rng.choice(["M", "F"]),
+        "age_months": round(rng.uniform(0, 60), 2),
+        "weight": round(rng.uniform(3, 20), 1),
+        "height": round(rng.uniform(50, 115), 1),
+        "head_circ": round(rng.uniform(34, 52), 1),
+    }
+
+
+_PYGROWUP = {
+    'wfa': lambda b: anthro.calc.wfa(b["weight"], b["age_months"], b["sex"]),
+    'lhfa': lambda b: anthro.calc.lhfa(b["height"], b["age_months"], b["sex"]),
+    'wfl': lambda b: anthro.calc.wfl(b["weight"], b["age_months"], b["sex"], b["height"]),
+    'bmifa': lambda b: anthro.calc.bmifa(b["weight"] / ((b["height"] / 100) ** 2), b["age_months"], b["sex"]),
+    'hcfa': lambda b: anthro.calc.hcfa(b["head_circ"], b["age_months"], b["sex"]),
+}
+
+
+def _pygrowup_zscores(body: dict) -> dict:
+    return {name: anthro._safe_z_calc(lambda: fn(body)) for name, fn in _PYGROWUP.items()}
+
+
+def _verify(bodies: list) -> int:
+    """Jumlah z-score fast path yang berbeda dari pygrowup"""
+    mismatches = 0
+    for body in bodies:
+        expected = _pygrowup_zscores(body)
+        actual = {
+            'wfa': anthro.lms_zscore('wfa', body["weight"], body["age_months"], body["sex"]),
+            'lhfa': anthro.lms_zscore('lhfa', body["height"], body["age_months"], body["sex"]),
+            'wfl': anthro.lms_zscore('wfl', body["weight"], body["age_months"], body["sex"], body["height"]),
+            'bmifa': anthro.lms_zscore('bmifa', body["weight"] / ((body["height"] / 100) ** 2),
+                                    body["age_months"], body["sex"]),
+            'hcfa': anthro.lms_zscore('hcfa', body["head_circ"], body["age_months"], body["sex"]),
+        }
+        for name, z in expected.items():
+            if actual[name] != z:
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"MISMATCH {name} {body}: fast={actual[name]} pygrowup={z}")
+    return mismatches
+
+
+def _percentiles(samples: list) -> tuple:
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=2000, help="Jumlah request")
+    parser.add_argument("--verify", action="store_true", help="Bandingkan fast path dengan pygrowup")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    bodies = [_random_body(rng) for _ in range(args.n)]
+
+    if args.verify:
+        mismatches = _verify(bodies)
+        print(f"verify: {mismatches} selisih dari {len(bodies) * len(_PYGROWUP)} z-score")
+        if mismatches:
+            raise SystemExit(1)
+
+    pygrowup = []
+    for body in bodies:
+        t0 = time.perf_counter()
+        _pygrowup_zscores(body)
+        pygrowup.append((time.perf_counter() - t0) * 1e6)
+
+    core = []
+    for body in bodies:
+        t0 = time.perf_counter()
+        anthro.analyze_anthropometry(body["sex"], body["age_months"], body["weight"],
+                                  body["height"], body["head_circ"])
+        core.append((time.perf_counter() - t0) * 1e6)
+
+    endpoint = []
+    with contextlib.redirect_stdout(io.StringIO()), TestClient(api.app) as client:
+        for body in bodies:
+            t0 = time.perf_counter()
+            response = client.post("/api/analyze", json=body)
+            endpoint.append((time.perf_counter() - t0) * 1e6)
+            if response.status_code not in (200, 422):
+                raise SystemExit(f"Unexpected status {response.status_code}: {response.text}")
+
+    print(f"\n{'path':<10} {'median (µs)':>12} {'p99 (µs)':>10}")
+    print("-" * 34)
+    for name, samples in (("pygrowup", pygrowup), ("core", core), ("endpoint", endpoint)):
+        median, p99 = _percentiles(samples)
+        print(f"{name:<10} {median:>12.0f} {p99:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#          AnthroHPK - BENCHMARK: Full Redraw vs Cached Chart Template
+#==============================================================================
+
+Membandingkan dua cara membuat PNG grafik pertumbuhan (BB/U, TB/U, LK/U, BB/TB):
+  - full redraw : plot_*() + savefig (zona, 7 garis SD, grid, legend tiap request)
+  - template    : render_growth_chart_image() (background di-cache, hanya overlay anak)
+
+RUN: python benchmarks/chart_templates.py [--n 30] [--dpi 100] [--sex M] [--theme pink_pastel]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+
+
+def _random_payload(sex: str, rng: random.Random) -> dict:
+    """Payload anak acak dalam rentang normal (agar tetap di area template)"""
+    age = round(rng.uniform(3, 57), 2)
+    w = round(rng.uniform(7, 14), 1)
+    h = round(rng.uniform(65, 100), 1)
+    hc = round(rng.uniform(40, 50), 1)
+    return {
+        'sex': sex,
+        'age_mo': age,
+        'w': w,
+        'h': h,
+        'hc': hc,
+        'z': app.calculate_all_zscores(sex, age, w, h, hc),
+    }
+
+
+def _time_ms(fn, payloads) -> list:
+    samples = []
+    for payload in payloads:
+        t0 = time.perf_counter()
+        fn(payload)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=30, help="Jumlah render per indikator")
+    parser.add_argument("--dpi", type=int, default=app.CHART_TEMPLATE_DPI)
+    parser.add_argument("--sex", choices=["M", "F"], default="M")
+    parser.add_argument("--theme", default="pink_pastel")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads = [_random_payload(args.sex, rng) for _ in range(args.n)]
+
+    print(f"Warming curves & templates (sex={args.sex}, theme={args.theme}, dpi={args.dpi}) ...")
+    t0 = time.perf_counter()
+    for indicator in app.GROWTH_CHART_SPECS:
+        for payload in payloads[:2]:
+            app.render_growth_chart_image(indicator, payload, args.theme, args.dpi)
+    print(f"Warm-up: {time.perf_counter() - t0:.1f} s\n")
+
+    def full_redraw(indicator):
+        def _render(payload):
+            fig = app._GROWTH_PLOTTERS[indicator](payload, args.theme)
+            try:
+                return app.figure_to_png_bytes(fig, args.dpi)
+            finally:
+                app.cleanup_matplotlib_figures(fig)
+        return _render
+
+    def template(indicator):
+        return lambda payload: app.render_growth_chart_image(indicator, payload, args.theme, args.dpi)
+
+    print(f"{'chart':<6} {'full redraw (ms)':>18} {'template (ms)':>15} {'speedup':>9}")
+    print("-" * 52)
+    for indicator in app.GROWTH_CHART_SPECS:
+        full = statistics.median(_time_ms(full_redraw(indicator), payloads))
+        fast = statistics.median(_time_ms(template(indicator), payloads))
+        print(f"{indicator:<6} {full:>18.1f} {fast:>15.1f} {full / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
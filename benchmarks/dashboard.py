@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#          AnthroHPK - BENCHMARK: Five Figures vs Composite Dashboard
+#==============================================================================
+
+Membandingkan biaya render grafik analisis komprehensif (tanpa chart_cache):
+  - five (full)     : lima figure terpisah, full redraw + tight_layout masing-masing
+  - five (template) : render_chart_image() per grafik (template cache, lihat Section 7C)
+  - dashboard       : render_dashboard_image(), satu figure dengan lima subplot
+                      (template dashboard: background keempat grafik di-cache)
+
+Ukuran output (bytes) juga dicetak untuk format yang dipilih.
+
+RUN: python benchmarks/dashboard.py [--n 20] [--theme pink_pastel] [--format png|png8|webp] [--dpi 100]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+
+
+def _random_payload(rng: random.Random) -> dict:
+    sex = rng.choice(["M", "F"])
+    age = round(rng.uniform(3, 57), 2)
+    w = round(rng.uniform(7, 14), 1)
+    h = round(rng.uniform(65, 100), 1)
+    hc = round(rng.uniform(40, 50), 1)
+    return {
+        'name_child': "Benchmark",
+        'sex': sex,
+        'age_mo': age,
+        'w': w,
+        'h': h,
+        'hc': hc,
+        'z': app.calculate_all_zscores(sex, age, w, h, hc),
+    }
+
+
+def _five_full(payload, theme, dpi, fmt):
+    images = []
+    for kind in app.CHART_KINDS:
+        plotter = app.plot_zscore_summary_bars if kind == 'bars' else app._GROWTH_PLOTTERS[kind]
+        fig = plotter(payload, theme)
+        images.append(app.figure_to_image_bytes(fig, dpi, fmt))
+        app.cleanup_matplotlib_figures(fig)
+    return images
+
+
+def _five_template(payload, theme, dpi, fmt):
+    return [app.render_chart_image(kind, payload, theme, dpi, fmt) for kind in app.CHART_KINDS]
+
+
+def _dashboard(payload, theme, dpi, fmt):
+    return [app.render_chart_image(app.DASHBOARD_KIND, payload, theme, dpi, fmt)]
+
+
+def _measure(render, payloads, theme, dpi, fmt):
+    samples, sizes = [], []
+    for payload in payloads:
+        t0 = time.perf_counter()
+        images = render(payload, theme, dpi, fmt)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        sizes.append(sum(len(image) for image in images))
+    return statistics.median(samples), statistics.median(sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=20, help="Jumlah analisis yang dirender")
+    parser.add_argument("--theme", default="pink_pastel")
+    parser.add_argument("--format", choices=sorted(app.CHART_IMAGE_FORMATS), default="png")
+    parser.add_argument("--dpi", type=int, default=app.CHART_TEMPLATE_DPI)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads = [app.chart_render_payload(_random_payload(rng)) for _ in range(args.n)]
+
+    print(f"theme: {args.theme} | format: {args.format} | dpi: {args.dpi}")
+    print("Warming curves (bisa > 1 menit pada cold start) ...")
+    t0 = time.perf_counter()
+    app.warm_growth_curves()
+    print(f"Warm-up: {time.perf_counter() - t0:.1f} s")
+
+    modes = [
+        ("five (full)", _five_full),
+        ("five (template)", _five_template),
+        ("dashboard", _dashboard),
+    ]
+
+    print(f"\n{'mode':<18} {'median (ms)':>12} {'bytes':>10}")
+    print("-" * 42)
+    for label, render in modes:
+        # Putaran pertama membangun template & cache font
+        for payload in payloads[:2]:
+            render(payload, args.theme, args.dpi, args.format)
+        median_ms, median_bytes = _measure(render, payloads, args.theme, args.dpi, args.format)
+        print(f"{label:<18} {median_ms:>12.1f} {median_bytes:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
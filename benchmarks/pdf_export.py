@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#          AnthroHPK - BENCHMARK: Raster vs Vector PDF Charts
+#==============================================================================
+
+Membandingkan pembuatan PDF laporan (halaman ringkasan + 5 grafik):
+  - raster : grafik dirender matplotlib (profil print) lalu di-embed sebagai gambar
+  - vector : grafik digambar langsung sebagai path reportlab (PDF_CHART_MODE=vector)
+
+chart_cache dikosongkan tiap iterasi sehingga raster mengukur render penuh.
+
+RUN: python benchmarks/pdf_export.py [--n 10] [--theme pink_pastel] [--profile print]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+
+
+def _random_payload(rng: random.Random, theme: str) -> dict:
+    sex = rng.choice(["M", "F"])
+    age = round(rng.uniform(3, 57), 2)
+    w = round(rng.uniform(7, 14), 1)
+    h = round(rng.uniform(65, 100), 1)
+    hc = round(rng.uniform(40, 50), 1)
+    return {
+        'name_child': "Benchmark",
+        'sex': sex,
+        'sex_text': "Laki-laki" if sex == "M" else "Perempuan",
+        'age_mo': age,
+        'age_days': int(age * 30.4375),
+        'w': w,
+        'h': h,
+        'hc': hc,
+        'z': app.calculate_all_zscores(sex, age, w, h, hc),
+        'theme': theme,
+    }
+
+
+def _export(payload: dict, mode: str, profile: dict) -> str:
+    figures = None
+    if mode == "raster":
+        images = app.render_charts_parallel(
+            payload, payload['theme'], dpi=app.profile_dpi(profile), fmt=profile['format']
+        )
+        figures = [images[kind] for kind in app.CHART_KINDS]
+    return app.export_to_pdf(payload, figures, f"benchmark_{mode}.pdf", chart_mode=mode)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=10, help="Jumlah PDF per mode")
+    parser.add_argument("--theme", default="pink_pastel")
+    parser.add_argument("--profile", default="print", choices=sorted(app.CHART_OUTPUT_PROFILES))
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads = [_random_payload(rng, args.theme) for _ in range(args.n)]
+    profile = app.resolve_output_profile(args.profile)
+
+    print("Warming curves (bisa > 1 menit pada cold start) ...")
+    t0 = time.perf_counter()
+    app.warm_growth_curves()
+    print(f"Warm-up: {time.perf_counter() - t0:.1f} s")
+
+    results = {}
+    for mode in app.PDF_CHART_MODES:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _export(payloads[0], mode, profile)  # template/font warm-up
+        samples, size = [], 0
+        for payload in payloads:
+            app.chart_cache.clear()
+            t0 = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                path = _export(payload, mode, profile)
+            samples.append((time.perf_counter() - t0) * 1000.0)
+            size = os.path.getsize(path)
+            os.remove(path)
+        results[mode] = (statistics.median(samples), size)
+
+    print(f"\n{'mode':<10} {'median (ms)':>12} {'bytes':>10}")
+    print("-" * 34)
+    for mode, (ms, size) in results.items():
+        print(f"{mode:<10} {ms:>12.1f} {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
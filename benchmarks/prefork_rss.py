@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#          AnthroHPK - BENCHMARK: RSS/PSS PER WORKER GUNICORN (PRE-FORK)
+#==============================================================================
+
+Menjalankan gunicorn (gunicorn.conf.py) dua kali:
+  - preload : app diimpor & state immutable dibangun di master, gc.freeze()
+  - no-preload : tiap worker mengimpor app & membangun state sendiri
+
+lalu membaca /proc/<pid>/smaps_rollup tiap worker setelah start dan setelah
+sejumlah request POST /api/analyze + GET perpustakaan:
+  - RSS : memori fisik worker (halaman bersama dihitung penuh)
+  - PSS : RSS dengan halaman bersama dibagi rata antar proses
+  - USS : halaman privat worker (yang benar-benar bertambah per worker)
+
+Jumlah worker yang muat di batas memori ≈ (batas - PSS master) / USS worker.
+Isi shared cache (kurva SD) dulu, mis. dengan satu kali run, agar start
+tidak menunggu perhitungan kurva.
+
+RUN: python benchmarks/prefork_rss.py [--workers 3] [--requests 200]  (Linux)
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _memory(pid: int) -> dict:
+    """RSS/PSS/USS (MB) dari smaps_rollup"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                values[parts[0][:-1]] = int(parts[1]) / 1024
+    return {
+        "rss": values.get("Rss", 0.0),
+        "pss": values.get("Pss", 0.0),
+        "uss": values.get("Private_Clean", 0.0) + values.get("Private_Dirty", 0.0),
+    }
+
+
+def _children(pid: int) -> list:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def _request(url: str, body: dict = None):
+    data = None if body is None else json.dumps(body).encode()
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        response.read()
+
+
+def _wait_ready(base: str, master: subprocess.Popen, workers: int, timeout: float):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if master.poll() is not None:
+            raise SystemExit("gunicorn exited during startup")
+        try:
+            _request(f"{base}/health")
+            if len(_children(master.pid)) >= workers:
+                return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise SystemExit("gunicorn did not become ready")
+
+
+def _summary(master_pid: int) -> dict:
+    workers = [_memory(pid) for pid in _children(master_pid)]
+    master = _memory(master_pid)
+    return {
+        "master_pss": master["pss"],
+        "worker_rss": sum(w["rss"] for w in workers) / len(workers),
+        "worker_pss": sum(w["pss"] for w in workers) / len(workers),
+        "worker_uss": sum(w["uss"] for w in workers) / len(workers),
+        "total_pss": master["pss"] + sum(w["pss"] for w in workers),
+    }
+
+
+def run(preload: bool, args) -> tuple:
+    env = dict(
+        os.environ,
+        PORT=str(args.port),
+        WEB_CONCURRENCY=str(args.workers),
+        GUNICORN_PRELOAD="1" if preload else "0",
+    )
+    master = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "app:app", "-c", "gunicorn.conf.py"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{args.port}"
+    try:
+        _wait_ready(base, master, args.workers, args.timeout)
+        # Beri waktu post_worker_init (tanpa preload) menyelesaikan warm-up
+        time.sleep(args.settle)
+        idle = _summary(master.pid)
+
+        for i in range(args.requests):
+            _request(f"{base}/api/analyze", {
+                "sex": "M" if i % 2 else "F",
+                "age_months": 1 + (i % 59),
+                "weight": 3.5 + (i % 150) / 10,
+                "height": 52 + (i % 60),
+            })
+            if i % 10 == 0:
+                _request(f"{base}/api/library?q=gizi")
+        loaded = _summary(master.pid)
+        return idle, loaded
+    finally:
+        master.send_signal(signal.SIGTERM)
+        master.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=3, help="WEB_CONCURRENCY")
+    parser.add_argument("--requests", type=int, default=200, help="Request setelah start")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--settle", type=float, default=10.0, help="Detik tunggu setelah siap")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Batas waktu start")
+    args = parser.parse_args()
+
+    rows = []
+    for preload in (True, False):
+        idle, loaded = run(preload, args)
+        name = "preload" if preload else "no-preload"
+        rows.append((f"{name} idle", idle))
+        rows.append((f"{name} +req", loaded))
+
+    print(f"\n{args.workers} workers, MB per worker (master PSS & total PSS in MB)")
+    print(f"{'mode':<18} {'RSS':>7} {'PSS':>7} {'USS':>7} {'master':>8} {'total':>8}")
+    print("-" * 60)
+    for name, s in rows:
+        print(f"{name:<18} {s['worker_rss']:>7.0f} {s['worker_pss']:>7.0f} {s['worker_uss']:>7.0f} "
+              f"{s['master_pss']:>8.0f} {s['total_pss']:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
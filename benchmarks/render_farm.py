@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#          AnthroHPK - BENCHMARK: Serial vs Parallel Chart Rendering
+#==============================================================================
+
+Membandingkan latensi render kelima grafik analisis komprehensif:
+  - serial   : render_charts_parallel() tanpa pool (satu per satu di proses ini)
+  - parallel : render_charts_parallel() dengan render farm
+               (ProcessPoolExecutor atau ThreadPoolExecutor, lihat --executor)
+
+Speedup hanya terlihat pada mesin multi-core (workers <= jumlah CPU).
+
+RUN: python benchmarks/render_farm.py [--n 20] [--workers 5] [--executor process|thread] [--theme pink_pastel]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+
+
+def _random_payload(rng: random.Random) -> dict:
+    sex = rng.choice(["M", "F"])
+    age = round(rng.uniform(3, 57), 2)
+    w = round(rng.uniform(7, 14), 1)
+    h = round(rng.uniform(65, 100), 1)
+    hc = round(rng.uniform(40, 50), 1)
+    return {
+        'name_child': "Benchmark",
+        'sex': sex,
+        'age_mo': age,
+        'w': w,
+        'h': h,
+        'hc': hc,
+        'z': app.calculate_all_zscores(sex, age, w, h, hc),
+    }
+
+
+def _median_ms(payloads, theme: str) -> float:
+    # Ukur render, bukan chart_cache
+    app.chart_cache.clear()
+    samples = []
+    for payload in payloads:
+        t0 = time.perf_counter()
+        app.render_charts_parallel(payload, theme)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=20, help="Jumlah analisis yang dirender")
+    parser.add_argument("--workers", type=int, default=len(app.CHART_KINDS))
+    parser.add_argument("--executor", choices=["process", "thread"], default=app.CHART_RENDER_EXECUTOR)
+    parser.add_argument("--theme", default="pink_pastel")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads = [_random_payload(rng) for _ in range(args.n)]
+
+    print(f"CPU: {os.cpu_count()} | workers: {args.workers} ({args.executor}) | theme: {args.theme}")
+    print("Warming curves (bisa > 1 menit pada cold start) ...")
+    t0 = time.perf_counter()
+    app.warm_growth_curves()
+    print(f"Warm-up: {time.perf_counter() - t0:.1f} s")
+
+    # Serial (pool belum dibuat) — dua putaran pertama membangun template
+    for payload in payloads[:2]:
+        app.render_charts_parallel(payload, args.theme)
+    serial = _median_ms(payloads, args.theme)
+
+    app.CHART_RENDER_WORKERS = args.workers
+    app.CHART_RENDER_EXECUTOR = args.executor
+    with contextlib.redirect_stdout(io.StringIO()):
+        app.start_chart_render_farm()
+        app._RENDER_POOL_READY.wait()
+    try:
+        for payload in payloads[:args.workers * 2]:
+            app.render_charts_parallel(payload, args.theme)
+        parallel = _median_ms(payloads, args.theme)
+    finally:
+        app.stop_chart_render_farm()
+
+    print(f"\n{'mode':<10} {'median (ms)':>12}")
+    print("-" * 24)
+    print(f"{'serial':<10} {serial:>12.1f}")
+    print(f"{'parallel':<10} {parallel:>12.1f}")
+    print(f"\nSpeedup: {serial / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
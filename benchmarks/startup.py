@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#        AnthroHPK - BENCHMARK: WAKTU IMPORT & WAKTU SAMPAI /health 200
+#==============================================================================
+
+Untuk tiap target (api:app dan/atau app:app):
+  1. python -X importtime -c "import <modul>" → laporan waktu import,
+     self time dijumlahkan per paket teratas (gradio, matplotlib, numpy, ...)
+  2. uvicorn <modul>:app di subprocess → detik dari start proses sampai
+     GET /health pertama yang menjawab 200
+
+Keluar dengan kode 1 bila waktu sampai /health melebihi budget target
+(--budget-api / --budget-app), sehingga bisa dipakai sebagai gate di CI.
+Isi shared cache (kurva SD) dulu, mis. dengan satu kali run, agar angka
+tidak didominasi perhitungan kurva.
+
+RUN: python benchmarks/startup.py [--target api app] [--top 15] [--runs 3]
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Detik sampai /health 200 (diukur ±1.0 s api, ±6.0 s app di mesin dev)
+DEFAULT_BUDGETS = {"api": 3.0, "app": 8.0}
+
+
+def import_profile(module: str) -> tuple:
+    """
+    Jalankan -X importtime untuk satu modul
+
+    Returns:
+        (total detik kumulatif modul, {paket teratas: detik self time})
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    per_package = defaultdict(float)
+    total = 0.0
+    for line in result.stderr.splitlines():
+        # "import time:       123 |       4567 |   package.sub"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2].strip()
+        per_package[name.split(".")[0]] += self_us / 1e6
+        if name == module:
+            total = cumulative_us / 1e6
+    return total, dict(per_package)
+
+
+def _healthy(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def time_to_health(module: str, port: int, timeout: float) -> float:
+    """Detik dari start uvicorn <module>:app sampai /health menjawab 200"""
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{module}:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/health"
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise SystemExit(f"uvicorn {module}:app exited during startup")
+            if _healthy(url):
+                return time.perf_counter() - started
+            time.sleep(0.05)
+        raise SystemExit(f"uvicorn {module}:app not healthy after {timeout:.0f}s")
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", nargs="+", default=["api", "app"], choices=sorted(DEFAULT_BUDGETS))
+    parser.add_argument("--top", type=int, default=15, help="Jumlah paket di laporan import")
+    parser.add_argument("--runs", type=int, default=3, help="Pengulangan start server (diambil median)")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--timeout", type=float, default=300.0, help="Batas waktu start server")
+    parser.add_argument("--budget-api", type=float, default=DEFAULT_BUDGETS["api"])
+    parser.add_argument("--budget-app", type=float, default=DEFAULT_BUDGETS["app"])
+    args = parser.parse_args()
+
+    over_budget = []
+    for target in args.target:
+        total, per_package = import_profile(target)
+        print(f"\n[{target}] import {target}: {total:.2f} s (-X importtime, self time per package)")
+        print(f"{'package':<28} {'self s':>8} {'share':>7}")
+        print("-" * 45)
+        ranked = sorted(per_package.items(), key=lambda item: item[1], reverse=True)
+        for name, seconds in ranked[:args.top]:
+            share = seconds / total * 100 if total else 0.0
+            print(f"{name:<28} {seconds:>8.3f} {share:>6.1f}%")
+
+        times = sorted(time_to_health(target, args.port, args.timeout) for _ in range(args.runs))
+        median = times[len(times) // 2]
+        budget = getattr(args, f"budget_{target}")
+        status = "OK" if median <= budget else "OVER BUDGET"
+        print(f"[{target}] first /health 200: median {median:.2f} s "
+              f"(min {times[0]:.2f}, max {times[-1]:.2f}) budget {budget:.1f} s → {status}")
+        if median > budget:
+            over_budget.append(target)
+
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
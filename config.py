@@ -10,6 +10,8 @@
 import os
 from datetime import datetime
 
+from modules.startup import startup_log
+
 # ==============================================================================
 # APPLICATION METADATA
 # ==============================================================================
@@ -56,6 +58,10 @@ BOUNDS = {
     'wfl_l': (45.0, 110.0)   # Weight-for-Length: length range
 }
 
+# Usia maksimum yang diterima input (bulan); di atas ini ditolak sebelum
+# dikonversi ke hari (int(1e308 * 30.4375) → OverflowError)
+AGE_MONTHS_MAX = 240
+
 # ==============================================================================
 # UI THEMES
 # ==============================================================================
@@ -325,4 +331,4 @@ MPASI_YOUTUBE_VIDEOS = {
     ]
 }
 
-print(f"✅ Config loaded: AnthroHPK v{APP_VERSION}")
+startup_log(f"✅ Config loaded: AnthroHPK v{APP_VERSION}")
@@ -10,6 +10,8 @@
 from typing import List, Dict, Optional
 import re
 
+from modules.startup import startup_log
+
 # ==============================================================================
 # KATEGORI ARTIKEL
 # ==============================================================================
@@ -827,4 +829,4 @@ def format_article_content(content: str) -> str:
     return html
 
 
-print(f"✅ Articles database loaded: {len(ARTIKEL_DATABASE)} articles")
+startup_log(f"✅ Articles database loaded: {len(ARTIKEL_DATABASE)} articles")
@@ -9,6 +9,8 @@
 
 from typing import List, Optional
 
+from modules.startup import startup_log
+
 # ==============================================================================
 # JADWAL IMUNISASI INDONESIA (Permenkes RI)
 # ==============================================================================
@@ -304,4 +306,4 @@ def generate_immunization_html(month: int, include_details: bool = True) -> str:
     return html
 
 
-print("✅ Immunization data loaded")
+startup_log("✅ Immunization data loaded")
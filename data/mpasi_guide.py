@@ -10,6 +10,8 @@
 
 from typing import List, Dict, Optional
 
+from modules.startup import startup_log
+
 # ==============================================================================
 # PANDUAN MPASI LENGKAP PER BULAN
 # ==============================================================================
@@ -546,4 +548,4 @@ def generate_mpasi_html(month: int) -> str:
     return html
 
 
-print("✅ MPASI Guide data loaded")
+startup_log("✅ MPASI Guide data loaded")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#          AnthroHPK - GUNICORN CONFIG (PRE-FORK, PRELOAD + gc.freeze)
+#==============================================================================
+
+app.py (Calculator + tabel WHO, database artikel, CUSTOM_CSS, Blocks Gradio)
+diimpor sekali di master; state read-only lainnya dibangun di sana lewat
+app.warm_immutable_state(freeze=True) lalu dibekukan dengan gc.freeze()
+sebelum worker di-fork, sehingga dibagi copy-on-write antar worker.
+
+RUN: gunicorn app:app -c gunicorn.conf.py
+     gunicorn api:app -c gunicorn.conf.py   (replika khusus API, tanpa Gradio)
+
+Env:
+  PORT               port (default 8000)
+  WEB_CONCURRENCY    jumlah worker uvicorn (default 2); status job export
+                     dibagi antar worker lewat shared cache (SHARED_CACHE_URL)
+  GUNICORN_PRELOAD   0 = tiap worker mengimpor app sendiri (untuk perbandingan RSS)
+"""
+
+import os
+
+# Render farm proses per worker akan berlipat dengan jumlah worker gunicorn:
+# default render in-process (set CHART_RENDER_WORKERS untuk mengubah)
+os.environ.setdefault("CHART_RENDER_WORKERS", "0")
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1").strip().lower() not in ("0", "false", "no")
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+
+def _app_module(app_uri: str):
+    """Modul entry point ('app' atau 'api') dari argumen 'modul:variabel' gunicorn"""
+    import importlib
+
+    return importlib.import_module(app_uri.split(":", 1)[0])
+
+
+def when_ready(server):
+    """Master: app sudah diimpor (preload) — warm-up & freeze sebelum fork worker"""
+    shared_cache_url = os.environ.get("SHARED_CACHE_URL", "").strip().lower()
+    if workers > 1 and shared_cache_url in ("off", "none", "0"):
+        # Status job export (/api/jobs) dibagi antar worker lewat shared cache
+        server.log.warning("SHARED_CACHE_URL=off with %d workers: /api/jobs/{id} only works on the "
+                           "worker that created the job (use WEB_CONCURRENCY=1 or sticky routing)", workers)
+    if not preload_app:
+        return
+    summary = _app_module(server.app.app_uri).warm_immutable_state(freeze=True)
+    server.log.info("Immutable state built in master: %s", summary)
+
+
+def post_worker_init(worker):
+    """Tanpa preload: warm-up yang sama di tiap worker (tanpa berbagi memori)"""
+    if preload_app:
+        return
+    summary = _app_module(worker.app.app_uri).warm_immutable_state()
+    worker.log.info("Immutable state built in worker %s: %s", worker.pid, summary)
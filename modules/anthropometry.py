@@ -0,0 +1,855 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - ANTHROPOMETRY MODULE
+#        Z-Score WHO (pygrowup + fast path LMS), Klasifikasi & Analisis Roster
+#==============================================================================
+
+Hanya numpy + pygrowup: dipakai app.py (UI Gradio) dan api.py (API ringan)
+tanpa menarik matplotlib maupun Gradio.
+"""
+
+import csv
+import io
+import json
+import math
+import os
+import sys
+import traceback
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CALC_CONFIG, AGE_MONTHS_MAX
+from modules.startup import startup_log
+from modules.utilities import (
+    as_float, parse_date, calculate_age_from_dates, z_to_percentile, format_zscore,
+    validate_anthropometry,
+)
+
+# WHO Growth Calculator
+try:
+    from pygrowup import Calculator
+    startup_log("✅ WHO Growth Calculator (pygrowup) loaded successfully")
+except ImportError as e:
+    print(f"❌ CRITICAL: pygrowup module not found! Error: {e}")
+    print("   Please ensure pygrowup package is in the same directory")
+    sys.exit(1)
+
+# ==============================================================================
+# WHO CALCULATOR INITIALIZATION
+# ==============================================================================
+
+# Initialize WHO Growth Calculator
+calc = None
+
+try:
+    calc = Calculator(**CALC_CONFIG)
+    startup_log("✅ WHO Calculator initialized successfully")
+    startup_log(f"   - Height adjustment: {CALC_CONFIG['adjust_height_data']}")
+    startup_log(f"   - Weight scores adjustment: {CALC_CONFIG['adjust_weight_scores']}")
+    startup_log(f"   - CDC standards: {CALC_CONFIG['include_cdc']}")
+except Exception as e:
+    print(f"❌ CRITICAL: WHO Calculator initialization failed!")
+    print(f"   Error: {e}")
+    print(f"   Traceback: {traceback.format_exc()}")
+    calc = None
+
+if calc is None:
+    print("⚠️  WARNING: Application will run with limited functionality")
+
+
+# ==============================================================================
+# WHO Z-SCORE CALCULATIONS
+# ==============================================================================
+
+def _safe_z_calc(calc_func, *args) -> Optional[float]:
+    """
+    Safely call WHO calculator function with error handling
+    
+    Args:
+        calc_func: Calculator method to call
+        *args: Arguments to pass to the calculator
+        
+    Returns:
+        Z-score float or None if calculation fails
+    """
+    if calc is None:
+        return None
+    
+    try:
+        z = calc_func(*args)
+        
+        if z is None:
+            return None
+        
+        z_float = float(z)
+        
+        # Check for invalid values (NaN or Inf)
+        if math.isnan(z_float) or math.isinf(z_float):
+            return None
+        
+        return z_float
+    except Exception as e:
+        # Silent failure for robustness
+        return None
+
+
+# -------------------------------------------------------------------
+# Fast path LMS (float)
+# -------------------------------------------------------------------
+# pygrowup menghitung rumus LMS dengan decimal.Decimal (~150 µs per indeks,
+# ~0.8 ms per anak). Jalur ini memakai tabel WHO & aturan pemilihan tabel
+# yang sama dari objek calc, tetapi aritmetika float lalu dibulatkan ke 0.01
+# seperti pygrowup (hasil identik, lihat benchmarks/analyze_api.py --verify).
+# Hanya untuk konfigurasi default; penyesuaian tinggi/z-score & CDC tetap
+# lewat pygrowup.
+LMS_FAST_PATH = calc is not None and not (
+    CALC_CONFIG['adjust_height_data']
+    or CALC_CONFIG['adjust_weight_scores']
+    or CALC_CONFIG['include_cdc']
+)
+
+_LMS_SEX_TABLE = {'M': 'boys', 'F': 'girls'}
+_DAYS_PER_MONTH = Decimal('30.4374')  # konstanta Observation.age_in_weeks pygrowup
+
+
+@lru_cache(maxsize=None)
+def _lms_row(table_name: str, key: str) -> Optional[Tuple[float, float, float]]:
+    """(L, M, S) baris tabel WHO pygrowup, None jika tidak ada"""
+    row = getattr(calc, table_name, {}).get(key)
+    if row is None:
+        return None
+    return float(row['L']), float(row['M']), float(row['S'])
+
+
+def warm_lms_rows() -> int:
+    """Isi lru_cache _lms_row untuk semua baris tabel WHO (mis. di master pre-fork)"""
+    count = 0
+    for table_name, table in vars(calc).items() if calc else ():
+        if not isinstance(table, dict):
+            continue
+        for key, row in table.items():
+            if isinstance(row, dict) and 'L' in row:
+                _lms_row(table_name, key)
+                count += 1
+    return count
+
+
+def lms_table_key(indicator: str, age_months: float, sex: str,
+                  height: Optional[float] = None) -> Optional[Tuple[str, str]]:
+    """
+    Nama tabel & key baris WHO untuk satu pengukuran (aturan pygrowup)
+    
+    Args:
+        indicator: 'wfa', 'lhfa', 'wfl', 'bmifa' atau 'hcfa'
+        age_months: Usia (bulan)
+        sex: 'M' atau 'F'
+        height: Panjang/tinggi (cm), wajib untuk 'wfl'
+        
+    Returns:
+        Tuple (nama tabel, key) atau None jika di luar tabel
+    """
+    sex_name = _LMS_SEX_TABLE.get(str(sex).upper())
+    if sex_name is None:
+        return None
+    
+    if indicator == 'wfl':
+        # Tabel BB/PB 45-120 cm per 0.5 cm; di atas 86 cm pakai tabel BB/TB
+        if height is None or not 45 <= height <= 120:
+            return None
+        table = f"wfh_{sex_name}_2_5" if height > 86 else f"wfl_{sex_name}_0_2"
+        half_cm = int(2 * height + 0.5)
+        return table, str(half_cm // 2) if half_cm % 2 == 0 else f"{half_cm // 2}.5"
+    
+    # Usia dibandingkan sebagai Decimal agar batas minggu/bulan sama persis
+    age = Decimal(age_months)
+    weeks = (age * _DAYS_PER_MONTH) / Decimal(7)
+    newborn = age <= 3 and weeks <= 13
+    if indicator == 'bmifa':
+        if newborn:
+            part = '0_13'
+        elif age < 24:
+            part = '0_2'
+        elif age <= 60:
+            part = '2_5'
+        else:
+            return None
+    else:
+        part = '0_13' if newborn else '0_5'
+    key = math.floor(weeks) if weeks <= 13 else math.floor(age)
+    return f"{indicator}_{sex_name}_{part}", str(key)
+
+
+def lms_zscore(indicator: str, measurement: Optional[float], age_months: float,
+               sex: str, height: Optional[float] = None) -> Optional[float]:
+    """
+    Z-score WHO dengan rumus LMS dalam float (padanan calc.<indicator>)
+    
+    Returns:
+        Z-score dibulatkan 0.01, atau None jika tidak bisa dihitung
+    """
+    try:
+        if measurement is None or measurement <= 0:
+            return None
+        lookup = lms_table_key(indicator, age_months, sex, height)
+        row = _lms_row(*lookup) if lookup else None
+        if row is None:
+            return None
+        
+        y = float(measurement)
+        if indicator == 'wfl' and 65.7 < y < 120.7:
+            # Sama dengan pygrowup (koreksi posisi berbaring diuji pada nilai ukur)
+            y -= 0.7
+        
+        box_cox, median, cv = row
+        z = ((y / median) ** box_cox - 1) / (cv * box_cox)
+        if math.isnan(z) or math.isinf(z):
+            return None
+        return round(z, 2)
+    except Exception:
+        return None
+
+
+def calculate_all_zscores(sex: str, 
+                          age_months: float, 
+                          weight: Optional[float], 
+                          height: Optional[float], 
+                          head_circ: Optional[float]) -> Dict[str, Optional[float]]:
+    """
+    Calculate all WHO z-scores for a child
+    
+    Args:
+        sex: 'M' (male) or 'F' (female)
+        age_months: Age in months
+        weight: Weight in kg
+        height: Height/length in cm
+        head_circ: Head circumference in cm
+        
+    Returns:
+        Dictionary with keys:
+            - waz: Weight-for-Age Z-score
+            - haz: Height-for-Age Z-score (or LAZ if < 24 months)
+            - whz: Weight-for-Height Z-score (or WFL if < 24 months)
+            - baz: BMI-for-Age Z-score
+            - hcz: Head Circumference-for-Age Z-score
+    """
+    results = {
+        'waz': None,
+        'haz': None,
+        'whz': None,
+        'baz': None,
+        'hcz': None
+    }
+    
+    if calc is None:
+        return results
+    
+    if LMS_FAST_PATH:
+        if weight is not None:
+            results['waz'] = lms_zscore('wfa', weight, age_months, sex)
+        if height is not None:
+            results['haz'] = lms_zscore('lhfa', height, age_months, sex)
+        if weight is not None and height is not None:
+            results['whz'] = lms_zscore('wfl', weight, age_months, sex, height)
+        if weight is not None and height is not None and height > 0:
+            results['baz'] = lms_zscore('bmifa', weight / ((height / 100) ** 2), age_months, sex)
+        if head_circ is not None:
+            results['hcz'] = lms_zscore('hcfa', head_circ, age_months, sex)
+        return results
+    
+    # Weight-for-Age (WAZ)
+    if weight is not None:
+        results['waz'] = _safe_z_calc(calc.wfa, weight, age_months, sex)
+    
+    # Height-for-Age (HAZ) / Length-for-Age (LAZ)
+    if height is not None:
+        results['haz'] = _safe_z_calc(calc.lhfa, height, age_months, sex)
+    
+    # Weight-for-Height (WHZ) / Weight-for-Length (WFL)
+    if weight is not None and height is not None:
+        results['whz'] = _safe_z_calc(calc.wfl, weight, age_months, sex, height)
+    
+    # BMI-for-Age (BAZ)
+    if weight is not None and height is not None and height > 0:
+        bmi = weight / ((height / 100) ** 2)
+        results['baz'] = _safe_z_calc(calc.bmifa, bmi, age_months, sex)
+    
+    # Head Circumference-for-Age (HCZ)
+    if head_circ is not None:
+        results['hcz'] = _safe_z_calc(calc.hcfa, head_circ, age_months, sex)
+    
+    return results
+
+
+def classify_permenkes_2020(z_scores: Dict[str, Optional[float]]) -> Dict[str, str]:
+    """
+    Classify nutritional status according to Permenkes RI No. 2 Tahun 2020
+    
+    Args:
+        z_scores: Dictionary of z-scores from calculate_all_zscores()
+        
+    Returns:
+        Dictionary with Permenkes classifications for each index
+    """
+    classifications = {}
+    
+    # Weight-for-Age (BB/U)
+    waz = z_scores.get('waz')
+    if waz is not None and not math.isnan(waz):
+        if waz < -3:
+            classifications['waz'] = "Berat Badan Sangat Kurang"
+        elif waz < -2:
+            classifications['waz'] = "Berat Badan Kurang"
+        elif waz <= 2:
+            classifications['waz'] = "Berat Badan Normal"
+        else:
+            classifications['waz'] = "Risiko Berat Badan Lebih"
+    else:
+        classifications['waz'] = "Data Tidak Tersedia"
+    
+    # Height-for-Age (TB/U)
+    haz = z_scores.get('haz')
+    if haz is not None and not math.isnan(haz):
+        if haz < -3:
+            classifications['haz'] = "Sangat Pendek (Severely Stunted)"
+        elif haz < -2:
+            classifications['haz'] = "Pendek (Stunted)"
+        elif haz <= 3:
+            classifications['haz'] = "Tinggi Badan Normal"
+        else:
+            classifications['haz'] = "Tinggi Badan Berlebih"
+    else:
+        classifications['haz'] = "Data Tidak Tersedia"
+    
+    # Weight-for-Height (BB/TB)
+    whz = z_scores.get('whz')
+    if whz is not None and not math.isnan(whz):
+        if whz < -3:
+            classifications['whz'] = "Gizi Buruk (Severely Wasted)"
+        elif whz < -2:
+            classifications['whz'] = "Gizi Kurang (Wasted)"
+        elif whz <= 2:
+            classifications['whz'] = "Gizi Baik (Normal)"
+        elif whz <= 3:
+            classifications['whz'] = "Berisiko Gizi Lebih (Possible Risk of Overweight)"
+        else:
+            classifications['whz'] = "Gizi Lebih (Overweight)"
+    else:
+        classifications['whz'] = "Data Tidak Tersedia"
+    
+    # BMI-for-Age (IMT/U)
+    baz = z_scores.get('baz')
+    if baz is not None and not math.isnan(baz):
+        if baz < -3:
+            classifications['baz'] = "Gizi Buruk (Severely Wasted)"
+        elif baz < -2:
+            classifications['baz'] = "Gizi Kurang (Wasted)"
+        elif baz <= 1:
+            classifications['baz'] = "Gizi Baik (Normal)"
+        elif baz <= 2:
+            classifications['baz'] = "Berisiko Gizi Lebih (Possible Risk of Overweight)"
+        elif baz <= 3:
+            classifications['baz'] = "Gizi Lebih (Overweight)"
+        else:
+            classifications['baz'] = "Obesitas (Obese)"
+    else:
+        classifications['baz'] = "Data Tidak Tersedia"
+    
+    # Head Circumference-for-Age (LK/U)
+    hcz = z_scores.get('hcz')
+    if hcz is not None and not math.isnan(hcz):
+        if abs(hcz) <= 2:
+            classifications['hcz'] = "Normal"
+        elif hcz < -2:
+            classifications['hcz'] = "Mikrosefali (perlu evaluasi)"
+        else:
+            classifications['hcz'] = "Makrosefali (perlu evaluasi)"
+    else:
+        classifications['hcz'] = "Data Tidak Tersedia"
+    
+    return classifications
+
+
+def classify_who_standards(z_scores: Dict[str, Optional[float]]) -> Dict[str, str]:
+    """
+    Classify nutritional status according to WHO Child Growth Standards
+    
+    Args:
+        z_scores: Dictionary of z-scores from calculate_all_zscores()
+        
+    Returns:
+        Dictionary with WHO classifications for each index
+    """
+    classifications = {}
+    
+    # Weight-for-Age
+    waz = z_scores.get('waz')
+    if waz is not None and not math.isnan(waz):
+        if waz < -3:
+            classifications['waz'] = "Severely underweight"
+        elif waz < -2:
+            classifications['waz'] = "Underweight"
+        elif waz <= 2:
+            classifications['waz'] = "Normal weight"
+        else:
+            classifications['waz'] = "Overweight"
+    else:
+        classifications['waz'] = "N/A"
+    
+    # Height-for-Age
+    haz = z_scores.get('haz')
+    if haz is not None and not math.isnan(haz):
+        if haz < -3:
+            classifications['haz'] = "Severely stunted"
+        elif haz < -2:
+            classifications['haz'] = "Stunted"
+        elif haz <= 3:
+            classifications['haz'] = "Normal height"
+        else:
+            classifications['haz'] = "Tall"
+    else:
+        classifications['haz'] = "N/A"
+    
+    # Weight-for-Height
+    whz = z_scores.get('whz')
+    if whz is not None and not math.isnan(whz):
+        if whz < -3:
+            classifications['whz'] = "Severely wasted"
+        elif whz < -2:
+            classifications['whz'] = "Wasted"
+        elif whz <= 2:
+            classifications['whz'] = "Normal"
+        elif whz <= 3:
+            classifications['whz'] = "Risk of overweight"
+        else:
+            classifications['whz'] = "Overweight"
+    else:
+        classifications['whz'] = "N/A"
+    
+    # BMI-for-Age
+    baz = z_scores.get('baz')
+    if baz is not None and not math.isnan(baz):
+        if baz < -3:
+            classifications['baz'] = "Severely wasted"
+        elif baz < -2:
+            classifications['baz'] = "Wasted"
+        elif baz <= 1:
+            classifications['baz'] = "Normal"
+        elif baz <= 2:
+            classifications['baz'] = "Risk of overweight"
+        elif baz <= 3:
+            classifications['baz'] = "Overweight"
+        else:
+            classifications['baz'] = "Obese"
+    else:
+        classifications['baz'] = "N/A"
+    
+    # Head Circumference-for-Age
+    hcz = z_scores.get('hcz')
+    if hcz is not None and not math.isnan(hcz):
+        if abs(hcz) <= 2:
+            classifications['hcz'] = "Normal"
+        elif hcz < -2:
+            classifications['hcz'] = "Microcephaly"
+        else:
+            classifications['hcz'] = "Macrocephaly"
+    else:
+        classifications['hcz'] = "N/A"
+    
+    return classifications
+
+
+def validate_zscores(z_scores: Dict[str, Optional[float]]) -> Tuple[List[str], List[str]]:
+    """
+    Validate z-scores for extreme values that need attention
+    
+    Args:
+        z_scores: Dictionary of z-scores
+        
+    Returns:
+        Tuple of (errors, warnings)
+    """
+    errors = []
+    warnings = []
+    
+    warn_threshold = 3
+    critical_threshold = 5
+    
+    for key, z in z_scores.items():
+        if z is None or math.isnan(z):
+            continue
+        
+        name = {
+            'waz': 'WAZ (BB/U)',
+            'haz': 'HAZ (TB/U)',
+            'whz': 'WHZ (BB/TB)',
+            'baz': 'BAZ (IMT/U)',
+            'hcz': 'HCZ (LK/U)'
+        }.get(key, key)
+        
+        abs_z = abs(z)
+        
+        if abs_z > critical_threshold:
+            errors.append(
+                f"🚨 {name} = {format_zscore(z)} sangat ekstrem (|Z| > {critical_threshold}). "
+                f"PENTING: Verifikasi ulang semua pengukuran dan konsultasi dokter anak."
+            )
+        elif abs_z > warn_threshold:
+            warnings.append(
+                f"⚠️ {name} = {format_zscore(z)} di luar rentang umum (|Z| > {warn_threshold}). "
+                f"Verifikasi ulang pengukuran atau konsultasi tenaga kesehatan."
+            )
+    
+    return errors, warnings
+
+
+def analyze_anthropometry(sex: str,
+                          age_months: float,
+                          weight: Optional[float],
+                          height: Optional[float],
+                          head_circ: Optional[float]) -> Dict[str, Any]:
+    """
+    Inti analisis tanpa grafik & export: z-score, persentil, klasifikasi
+    
+    Args:
+        sex: 'M' (male) or 'F' (female)
+        age_months: Age in months
+        weight, height, head_circ: Pengukuran (kg, cm, cm)
+        
+    Returns:
+        Dict dengan keys:
+            - z: Hasil calculate_all_zscores()
+            - percentiles: Persentil per indeks
+            - permenkes: Klasifikasi Permenkes 2020
+            - who: Klasifikasi WHO
+            - alerts, warnings: Hasil validate_zscores()
+    """
+    z_scores = calculate_all_zscores(sex, age_months, weight, height, head_circ)
+    alerts, warnings_list = validate_zscores(z_scores)
+    return {
+        'z': z_scores,
+        'percentiles': {key: z_to_percentile(z) for key, z in z_scores.items()},
+        'permenkes': classify_permenkes_2020(z_scores),
+        'who': classify_who_standards(z_scores),
+        'alerts': alerts,
+        'warnings': warnings_list,
+    }
+
+
+# ==============================================================================
+# COHORT ANALYSIS (BATCH, VECTORIZED Z-SCORE)
+# ==============================================================================
+
+# Roster satu desa/posyandu: baris dianalisis per chunk (hasil di-stream per chunk)
+COHORT_CHUNK_ROWS = int(os.environ.get("COHORT_CHUNK_ROWS", "500"))
+COHORT_MAX_ROWS = int(os.environ.get("COHORT_MAX_ROWS", "50000"))
+
+# Nama kolom yang diterima (CSV/NDJSON) → nama field internal
+COHORT_FIELD_ALIASES = {
+    'id': 'id', 'no': 'id', 'nik': 'id',
+    'name_child': 'name_child', 'name': 'name_child', 'nama': 'name_child', 'nama_anak': 'name_child',
+    'sex': 'sex', 'gender': 'sex', 'jenis_kelamin': 'sex', 'jk': 'sex',
+    'dob': 'dob', 'tanggal_lahir': 'dob', 'tgl_lahir': 'dob',
+    'dom': 'dom', 'tanggal_ukur': 'dom', 'tgl_ukur': 'dom',
+    'age_months': 'age_months', 'age': 'age_months', 'usia_bulan': 'age_months', 'umur_bulan': 'age_months',
+    'weight': 'weight', 'bb': 'weight', 'berat': 'weight',
+    'height': 'height', 'tb': 'height', 'pb': 'height', 'tinggi': 'height',
+    'head_circ': 'head_circ', 'lk': 'head_circ', 'lingkar_kepala': 'head_circ',
+}
+
+# Urutan indeks di hasil & kolom CSV
+COHORT_INDICES = ('waz', 'haz', 'whz', 'baz', 'hcz')
+
+
+def sex_code(value: Any) -> Optional[str]:
+    """'M'/'F'/'L'/'P'/'Laki-laki'/'Perempuan' → kode WHO 'M'/'F' (None jika tidak dikenal)"""
+    value = str(value or "").strip().lower()
+    if value in ("m", "l") or value.startswith("laki"):
+        return "M"
+    if value in ("f", "p") or value.startswith("perempuan"):
+        return "F"
+    return None
+
+
+def _measurement(value: Any) -> Tuple[Optional[float], Optional[str]]:
+    """
+    as_float untuk sel roster, dengan alasan bila tidak terpakai
+
+    Returns:
+        (angka, None), (None, 'missing') untuk sel kosong/'nan'/bukan angka,
+        atau (None, 'non_finite') untuk 'inf'/'1e400'
+    """
+    number = as_float(value)
+    if number is None or math.isnan(number):
+        return None, 'missing'
+    if math.isinf(number):
+        return None, 'non_finite'
+    return number, None
+
+
+def parse_child_measurements(child: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[str], List[str]]:
+    """
+    Validasi data satu anak dari batch (roster CSV/NDJSON, laporan posyandu)
+    
+    Args:
+        child: Dict sex, age_months (atau dob + dom), weight, height, head_circ
+        
+    Returns:
+        Tuple (pengukuran {sex, age_mo, age_days, w, h, hc, dob, dom} atau
+        None jika tidak valid, errors, warnings)
+    """
+    errors = []
+    
+    sex = sex_code(child.get('sex'))
+    if sex is None:
+        errors.append("❌ Jenis kelamin tidak dikenal")
+    
+    dob, dom = parse_date(child.get('dob') or ""), parse_date(child.get('dom') or "")
+    (age_mo, age_reason), age_days = _measurement(child.get('age_months')), None
+    if age_reason == 'non_finite':
+        errors.append(f"❌ Usia di luar rentang yang didukung (0-{AGE_MONTHS_MAX} bulan)")
+    else:
+        if age_mo is None and dob and dom:
+            age_mo, age_days = calculate_age_from_dates(dob, dom)
+        if age_mo is None:
+            errors.append("❌ Usia (bulan) atau tanggal lahir + tanggal pengukuran diperlukan")
+    
+    (w, w_reason), (h, h_reason) = _measurement(child.get('weight')), _measurement(child.get('height'))
+    hc, hc_reason = _measurement(child.get('head_circ'))
+    if 'non_finite' in (w_reason, h_reason, hc_reason):
+        errors.append("❌ Berat, panjang/tinggi dan lingkar kepala harus berupa angka terhingga")
+    elif w is None or h is None:
+        errors.append("❌ Berat dan panjang/tinggi badan diperlukan")
+    
+    if errors:
+        return None, errors, []
+    errors, warnings_list = validate_anthropometry(age_mo, w, h, hc)
+    if errors:
+        return None, errors, warnings_list
+    
+    return {
+        'sex': sex,
+        'age_mo': age_mo,
+        'age_days': age_days if age_days is not None else int(age_mo * 30.4375),
+        'w': w,
+        'h': h,
+        'hc': hc,
+        'dob': dob,
+        'dom': dom,
+    }, [], warnings_list
+
+
+def _lms_zscores_array(indicator: str, measurement: np.ndarray, age_months: np.ndarray,
+                       sexes: List[str], height: Optional[np.ndarray] = None) -> List[Optional[float]]:
+    """
+    lms_zscore untuk satu kolom pengukuran sekaligus
+    
+    Pemilihan baris tabel tetap per anak (batas usia/minggu dibandingkan
+    sebagai Decimal seperti pygrowup); rumus LMS dihitung sebagai array
+    numpy. Pembulatan 0.01 memakai round() per nilai agar identik dengan
+    lms_zscore (np.round bisa berbeda tepat di batas .xx5).
+    """
+    n = len(measurement)
+    lms = np.full((n, 3), np.nan)
+    for i in range(n):
+        if not measurement[i] > 0:  # juga menolak NaN (data kosong)
+            continue
+        row_height = None
+        if height is not None:
+            if math.isnan(height[i]):
+                continue
+            row_height = float(height[i])
+        lookup = lms_table_key(indicator, float(age_months[i]), sexes[i], row_height)
+        row = _lms_row(*lookup) if lookup else None
+        if row is not None:
+            lms[i] = row
+    
+    y = measurement.astype(float)
+    if indicator == 'wfl':
+        y = np.where((y > 65.7) & (y < 120.7), y - 0.7, y)
+    box_cox, median, cv = lms[:, 0], lms[:, 1], lms[:, 2]
+    with np.errstate(all='ignore'):
+        z = ((y / median) ** box_cox - 1) / (cv * box_cox)
+    return [round(value, 2) if math.isfinite(value) else None for value in z.tolist()]
+
+
+def calculate_zscores_batch(sexes: List[str], age_months: List[float],
+                            weight: List[Optional[float]], height: List[Optional[float]],
+                            head_circ: List[Optional[float]]) -> List[Dict[str, Optional[float]]]:
+    """
+    calculate_all_zscores untuk banyak anak sekaligus (hasil identik)
+    
+    Args:
+        sexes, age_months, weight, height, head_circ: List sejajar per anak
+            (None = tidak diukur)
+        
+    Returns:
+        List dict z-score (keys sama dengan calculate_all_zscores)
+    """
+    if not LMS_FAST_PATH:
+        return [
+            calculate_all_zscores(*values)
+            for values in zip(sexes, age_months, weight, height, head_circ)
+        ]
+    
+    def column(values):
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+    
+    age, w, h, hc = column(age_months), column(weight), column(height), column(head_circ)
+    with np.errstate(all='ignore'):
+        bmi = np.where(h > 0, w / (h / 100) ** 2, np.nan)
+    columns = {
+        'waz': _lms_zscores_array('wfa', w, age, sexes),
+        'haz': _lms_zscores_array('lhfa', h, age, sexes),
+        'whz': _lms_zscores_array('wfl', w, age, sexes, h),
+        'baz': _lms_zscores_array('bmifa', bmi, age, sexes),
+        'hcz': _lms_zscores_array('hcfa', hc, age, sexes),
+    }
+    return [{key: columns[key][i] for key in COHORT_INDICES} for i in range(len(sexes))]
+
+
+def _parse_cohort_row(row: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[str], List[str]]:
+    """
+    parse_child_measurements untuk satu baris roster yang tidak pernah raise
+
+    Satu baris rusak tidak boleh memutus stream /api/analyze/batch di tengah
+    jalan; kegagalan tak terduga menjadi record error di posisinya sendiri.
+    """
+    if '_error' in row:
+        return None, [row['_error']], []
+    try:
+        return parse_child_measurements(row)
+    except (ArithmeticError, ValueError, TypeError) as e:
+        return None, [f"❌ Data baris tidak dapat diproses: {e}"], []
+
+
+def analyze_cohort_rows(rows: List[Dict[str, Any]], first_row: int = 1) -> List[Dict[str, Any]]:
+    """
+    Analisis satu chunk roster: validasi per baris, z-score vektor,
+    persentil & klasifikasi per anak
+    
+    Args:
+        rows: Dict per anak (nama field sudah dinormalisasi, lihat read_cohort_rows)
+        first_row: Nomor baris data pertama chunk ini (1-based)
+        
+    Returns:
+        List hasil per baris (urutan input), baris tidak valid berisi 'errors'
+    """
+    parsed = [_parse_cohort_row(row) for row in rows]
+    valid = [m for m, _, _ in parsed if m is not None]
+    z_list = iter(calculate_zscores_batch(
+        [m['sex'] for m in valid], [m['age_mo'] for m in valid],
+        [m['w'] for m in valid], [m['h'] for m in valid], [m['hc'] for m in valid],
+    ))
+    
+    results = []
+    for offset, (row, (m, errors, warnings_list)) in enumerate(zip(rows, parsed)):
+        result = {
+            'row': first_row + offset,
+            'id': row.get('id'),
+            'name_child': row.get('name_child'),
+        }
+        if m is None:
+            result.update({'errors': errors, 'warnings': warnings_list})
+            results.append(result)
+            continue
+        
+        z_scores = next(z_list)
+        alerts, z_warnings = validate_zscores(z_scores)
+        result.update({
+            'sex': m['sex'],
+            'age_months': round(m['age_mo'], 2),
+            'weight': m['w'],
+            'height': m['h'],
+            'head_circ': m['hc'],
+            'z': z_scores,
+            'percentiles': {key: z_to_percentile(z) for key, z in z_scores.items()},
+            'permenkes': classify_permenkes_2020(z_scores),
+            'who': classify_who_standards(z_scores),
+            'alerts': alerts,
+            'errors': [],
+            'warnings': warnings_list + z_warnings,
+        })
+        results.append(result)
+    return results
+
+
+def read_cohort_rows(data: bytes, fmt: str) -> List[Dict[str, Any]]:
+    """
+    Parse roster upload ke list dict dengan nama field internal
+    
+    Args:
+        data: Isi upload (UTF-8, BOM diperbolehkan)
+        fmt: 'csv' (header wajib; pemisah , atau ;) atau 'ndjson' (satu objek JSON per baris)
+        
+    Returns:
+        List dict per anak (kolom tak dikenal diabaikan; baris NDJSON yang
+        rusak menjadi {'_error': ...})
+    """
+    text = data.decode('utf-8-sig')
+    
+    def normalize(record: Dict[str, Any]) -> Dict[str, Any]:
+        row = {}
+        for key, value in record.items():
+            field = COHORT_FIELD_ALIASES.get(str(key or "").strip().lower())
+            if field is not None and value not in (None, ""):
+                row[field] = value.strip() if isinstance(value, str) else value
+        return row
+    
+    if fmt == 'csv':
+        # Reader langsung di atas teks (bukan splitlines) agar field ber-quote
+        # yang berisi baris baru (alamat/catatan dari Excel) tetap satu record
+        header = next((line for line in text.splitlines() if line.strip()), "")
+        delimiter = ';' if header.count(';') > header.count(',') else ','
+        reader = csv.DictReader(io.StringIO(text.lstrip("\r\n"), newline=''), delimiter=delimiter)
+        rows = []
+        for record in reader:
+            row = normalize(record)
+            if row:  # baris kosong / hanya pemisah
+                rows.append(row)
+        return rows
+    
+    rows = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            rows.append({'_error': f"❌ JSON tidak valid: {e.msg}"})
+            continue
+        rows.append(normalize(record) if isinstance(record, dict) else {'_error': "❌ Baris harus objek JSON"})
+    return rows
+
+
+COHORT_CSV_COLUMNS = (
+    ['row', 'id', 'name_child', 'sex', 'age_months', 'weight', 'height', 'head_circ']
+    + [f"z_{key}" for key in COHORT_INDICES]
+    + [f"percentile_{key}" for key in COHORT_INDICES]
+    + [f"permenkes_{key}" for key in COHORT_INDICES]
+    + [f"who_{key}" for key in COHORT_INDICES]
+    + ['alerts', 'errors', 'warnings']
+)
+
+
+def cohort_result_csv_rows(results: List[Dict[str, Any]]) -> List[List[Any]]:
+    """Ratakan hasil analyze_cohort_rows ke baris CSV (urutan COHORT_CSV_COLUMNS)"""
+    rows = []
+    for result in results:
+        flat = {key: result.get(key) for key in COHORT_CSV_COLUMNS[:8]}
+        for group, prefix in (('z', 'z'), ('percentiles', 'percentile'), ('permenkes', 'permenkes'), ('who', 'who')):
+            for key in COHORT_INDICES:
+                flat[f"{prefix}_{key}"] = (result.get(group) or {}).get(key)
+        for key in ('alerts', 'errors', 'warnings'):
+            flat[key] = "; ".join(result.get(key) or [])
+        rows.append(["" if flat[column] is None else flat[column] for column in COHORT_CSV_COLUMNS])
+    return rows
+
+
+startup_log("✅ Anthropometry module loaded")
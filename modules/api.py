@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - API MODULE
+#   Endpoint JSON Ringan: Analisis, Roster, Perpustakaan, Kejar Tumbuh, Kurva
+#==============================================================================
+
+Router tanpa Gradio/matplotlib, dipasang di app.py (bersama UI) maupun di
+api.py (replika khusus API). Grafik Kejar Tumbuh hanya tersedia bila
+pemanggil memberi hook kejar_tumbuh_plot (app.py).
+"""
+
+import csv
+import io
+import json
+import math
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Request, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import UI_THEMES, AGE_MONTHS_MAX
+from data.library import ARTIKEL_LOKAL_DATABASE, get_local_library_filters, filter_library_items
+from modules.utilities import parse_date, calculate_age_from_dates, validate_anthropometry
+from modules.anthropometry import (
+    sex_code, analyze_anthropometry, analyze_cohort_rows, read_cohort_rows,
+    cohort_result_csv_rows, COHORT_CHUNK_ROWS, COHORT_MAX_ROWS, COHORT_CSV_COLUMNS,
+)
+from modules.growth_curves import GROWTH_CHART_SPECS, growth_chart_reference_traces
+from modules.kejar_tumbuh import hitung_kejar_tumbuh
+from modules.cpu_executor import cpu_executor
+from modules.startup import startup_log
+
+# Hook grafik Kejar Tumbuh: (data_list, gender, request, profile) → (plot_path, nama profil output)
+KejarTumbuhPlotHook = Callable[[List[Dict[str, float]], str, Request, Optional[str]],
+                               Tuple[Optional[str], Optional[str]]]
+
+# ==============================================================================
+# PYDANTIC MODELS
+# ==============================================================================
+
+class KejarTumbuhDataPoint(BaseModel):
+    usia_bulan: float = Field(..., allow_inf_nan=False)
+    bb: float = Field(..., allow_inf_nan=False)
+    tb: float = Field(..., allow_inf_nan=False)
+
+
+class KejarTumbuhRequest(BaseModel):
+    gender: str  # "Laki-laki" atau "Perempuan"
+    data: List[KejarTumbuhDataPoint]
+    theme: Optional[str] = "pink_pastel"
+
+
+class AnalyzeRequest(BaseModel):
+    sex: str  # "M"/"F" atau "Laki-laki"/"Perempuan"
+    age_months: Optional[float] = Field(None, ge=0, le=AGE_MONTHS_MAX, allow_inf_nan=False)  # atau dob + dom
+    dob: Optional[str] = None  # YYYY-MM-DD atau DD/MM/YYYY
+    dom: Optional[str] = None
+    weight: float = Field(..., allow_inf_nan=False)
+    height: float = Field(..., allow_inf_nan=False)
+    head_circ: Optional[float] = Field(None, allow_inf_nan=False)
+
+
+# ==============================================================================
+# HELPERS
+# ==============================================================================
+
+def api_sex_code(sex: str) -> str:
+    """'M'/'F'/'Laki-laki'/'Perempuan' → kode WHO 'M' atau 'F'"""
+    code = sex_code(sex)
+    if code is not None:
+        return code
+    raise HTTPException(status_code=422, detail="sex harus 'M'/'F' atau 'Laki-laki'/'Perempuan'")
+
+
+def _json_safe(value):
+    """NaN/inf → string (JSON standar tidak punya NaN/Infinity), rekursif"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    return value
+
+
+async def request_validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    """
+    422 validasi body yang tetap bisa di-serialize
+
+    Handler bawaan FastAPI menggemakan input ke body error; input NaN/inf
+    (mis. {"weight": NaN}) membuat JSONResponse gagal → 500. Nilai
+    non-finite dikirim sebagai string.
+    """
+    return JSONResponse(status_code=422, content={"detail": _json_safe(jsonable_encoder(exc.errors()))})
+
+
+def _cohort_upload_format(content_type: str, filename: str, data: bytes) -> str:
+    """'csv' atau 'ndjson' dari Content-Type, ekstensi file, atau isi upload"""
+    content_type, filename = content_type.lower(), filename.lower()
+    if "csv" in content_type or filename.endswith(".csv"):
+        return "csv"
+    if "ndjson" in content_type or "jsonl" in content_type or filename.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return "ndjson" if data.lstrip(b"\xef\xbb\xbf \t\r\n")[:1] == b"{" else "csv"
+
+
+# ==============================================================================
+# ROUTER
+# ==============================================================================
+
+def build_api_router(kejar_tumbuh_plot: Optional[KejarTumbuhPlotHook] = None) -> APIRouter:
+    """
+    Router endpoint API ringan (tanpa Gradio/matplotlib)
+
+    Args:
+        kejar_tumbuh_plot: Hook grafik Kejar Tumbuh (opsional). Tanpa hook,
+            /api/kejar-tumbuh/analyze hanya mengembalikan analisis HTML.
+
+    Returns:
+        APIRouter untuk app.include_router()
+    """
+    router = APIRouter()
+
+    # --- Perpustakaan Ibu Balita ---
+
+    @router.get("/api/library/meta")
+    async def library_meta():
+        """
+        Metadata singkat Perpustakaan Ibu Balita:
+        - jumlah artikel
+        - daftar kategori
+        - daftar sumber
+        """
+        try:
+            kategori_list, sumber_list = get_local_library_filters()
+            kategori_unik = sorted(set(kategori_list))
+            sumber_unik = sorted(set(sumber_list))
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Gagal membaca metadata perpustakaan: {e}",
+            )
+
+        return {
+            "jumlah_artikel": len(ARTIKEL_LOKAL_DATABASE),
+            "kategori": kategori_unik,
+            "sumber": sumber_unik,
+        }
+
+    @router.get("/api/library")
+    async def library_list(
+        q: str = Query("", alias="q", description="Kata kunci bebas (judul, ringkasan, isi)"),
+        kategori: str = Query("", alias="kategori", description="Filter kategori (opsional)"),
+        sumber: str = Query("", alias="sumber", description="Filter sumber (opsional, persis teks sumber)"),
+    ):
+        """
+        Mengembalikan daftar artikel Perpustakaan Ibu Balita dalam bentuk JSON.
+
+        Contoh:
+          - /api/library             -> semua artikel
+          - /api/library?q=stunting  -> semua artikel yang mengandung kata 'stunting'
+          - /api/library?kategori=Gizi
+          - /api/library?sumber=Kemenkes RI
+        """
+        try:
+            items = filter_library_items(q=q, kategori=kategori, sumber=sumber)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Gagal memproses filter perpustakaan: {e}",
+            )
+
+        return {
+            "count": len(items),
+            "items": items,
+        }
+
+    @router.get("/api/library/{item_id}")
+    async def library_detail(item_id: int):
+        """
+        Ambil detail satu artikel perpustakaan berdasarkan index (0-based).
+
+        Catatan:
+        - `item_id` di sini sama dengan index yang dipakai di front-end (kartu).
+        """
+        try:
+            art = ARTIKEL_LOKAL_DATABASE[item_id]
+        except (IndexError, TypeError):
+            raise HTTPException(
+                status_code=404,
+                detail="Artikel perpustakaan tidak ditemukan",
+            )
+
+        return {
+            "id": item_id,
+            "title": art.get("title", ""),
+            "kategori": art.get("kategori", ""),
+            "source": art.get("source", ""),
+            "summary": art.get("summary", ""),
+            "full_content": art.get("full_content", ""),
+        }
+
+    # --- Kalkulator Kejar Tumbuh ---
+
+    @router.post("/api/kejar-tumbuh/analyze")
+    async def kejar_tumbuh_analyze(
+        payload: KejarTumbuhRequest,
+        request: Request,
+        profile: Optional[str] = Query(None, description="mobile | desktop | print")
+    ):
+        """
+        Analisis Kejar Tumbuh via API.
+
+        Grafik (plot_path) hanya dibuat bila router dipasang dengan hook
+        kejar_tumbuh_plot; resolusi & format grafik mengikuti ?profile= atau
+        header perangkat (X-Output-Profile, Save-Data, Sec-CH-UA-Mobile, User-Agent).
+        Tanpa hook (api.py) plot_path & output_profile bernilai null.
+        Analisis & grafik dijalankan di cpu_executor (endpoint
+        "kejar_tumbuh_analyze": batas konkurensi → 503, timeout → 504).
+
+        Body (JSON) contoh:
+        {
+          "gender": "Laki-laki",
+          "theme": "pink_pastel",
+          "data": [
+            {"usia_bulan": 6.0, "bb": 7.2, "tb": 66.0},
+            {"usia_bulan": 9.0, "bb": 7.8, "tb": 70.0}
+          ]
+        }
+        """
+        # Konversi Pydantic → list dict seperti yang digunakan kalkulator
+        data_list = [
+            {
+                "usia_bulan": float(p.usia_bulan),
+                "bb": float(p.bb),
+                "tb": float(p.tb),
+            }
+            for p in payload.data
+        ]
+
+        if len(data_list) < 2:
+            raise HTTPException(
+                status_code=400,
+                detail="Minimal diperlukan 2 pengukuran untuk analisis Kejar Tumbuh."
+            )
+
+        gender = payload.gender
+
+        def compute():
+            # Handler UI sudah menggunakan gender dalam bahasa Indonesia ("Laki-laki"/"Perempuan")
+            html = hitung_kejar_tumbuh(data_list)
+            plot_path, output_profile = None, None
+            if kejar_tumbuh_plot is not None:
+                plot_path, output_profile = kejar_tumbuh_plot(data_list, gender, request, profile)
+            return html, plot_path, output_profile
+
+        html, plot_path, output_profile = await cpu_executor.run("kejar_tumbuh_analyze", compute)
+
+        return {
+            "gender": gender,
+            "theme": payload.theme or "pink_pastel",
+            "poin_pengukuran": len(data_list),
+            "html": html,
+            "plot_path": plot_path,  # path relatif di server (jika ingin diakses via /outputs)
+            "output_profile": output_profile,
+        }
+
+    # --- Analisis cepat (JSON saja, tanpa grafik/export) ---
+
+    @router.post("/api/analyze")
+    async def analyze(payload: AnalyzeRequest):
+        """
+        Z-score, persentil, klasifikasi Permenkes 2020 & WHO dalam JSON.
+
+        Jalur ringan untuk aplikasi mitra & load test: tanpa grafik, PDF, CSV
+        maupun file. Komputasi < 1 ms, jadi dijalankan langsung di event loop
+        (async) tanpa pindah ke threadpool. Usia dari age_months, atau dari
+        dob + dom bila age_months kosong.
+        """
+        sex = api_sex_code(payload.sex)
+        age_mo, age_days = payload.age_months, None
+        if age_mo is None:
+            dob, dom = parse_date(payload.dob or ""), parse_date(payload.dom or "")
+            if dob is None or dom is None:
+                raise HTTPException(
+                    status_code=422,
+                    detail="age_months, atau dob + dom (YYYY-MM-DD / DD/MM/YYYY), wajib diisi",
+                )
+            age_mo, age_days = calculate_age_from_dates(dob, dom)
+            if age_mo is None:
+                raise HTTPException(status_code=422, detail="dom harus setelah dob")
+
+        errors, warnings_list = validate_anthropometry(
+            age_mo, payload.weight, payload.height, payload.head_circ
+        )
+        if errors:
+            raise HTTPException(status_code=422, detail=errors)
+
+        results = analyze_anthropometry(sex, age_mo, payload.weight, payload.height, payload.head_circ)
+        return {
+            "sex": sex,
+            "age_months": round(age_mo, 2),
+            "age_days": age_days if age_days is not None else int(age_mo * 30.4375),
+            "bmi": round(payload.weight / ((payload.height / 100) ** 2), 2),
+            "z": results['z'],
+            "percentiles": results['percentiles'],
+            "permenkes": results['permenkes'],
+            "who": results['who'],
+            "alerts": results['alerts'],
+            "warnings": warnings_list + results['warnings'],
+        }
+
+    # --- Analisis roster (NDJSON/CSV, streaming per chunk) ---
+
+    @router.post("/api/analyze/batch")
+    async def analyze_batch(
+        request: Request,
+        format: Optional[str] = Query(None, description="ndjson | csv (default mengikuti Accept)")
+    ):
+        """
+        Analisis roster satu posyandu/desa: z-score, persentil & klasifikasi per anak.
+
+        Body: NDJSON (satu objek per baris) atau CSV dengan header, langsung
+        atau sebagai field 'file' multipart. Kolom: sex, age_months (atau
+        dob + dom), weight, height, head_circ, opsional id/name_child (alias
+        Indonesia seperti jk, usia_bulan, bb, tb, lk juga diterima).
+
+        Baris diproses per COHORT_CHUNK_ROWS lewat jalur z-score vektor di
+        threadpool, dan hasil tiap chunk langsung di-stream: NDJSON (default)
+        atau CSV (?format=csv / Accept: text/csv). Baris tidak valid tetap
+        muncul dengan 'errors' sehingga urutan hasil = urutan input.
+        """
+        content_type = request.headers.get("content-type", "")
+        filename = ""
+        if content_type.startswith("multipart/form-data"):
+            form = await request.form()
+            upload = form.get("file")
+            if upload is None or isinstance(upload, str):
+                raise HTTPException(status_code=422, detail="Field 'file' (CSV/NDJSON) wajib diisi")
+            filename, content_type = upload.filename or "", upload.content_type or ""
+            data = await upload.read()
+        else:
+            # Body dibaca penuh sebelum streaming: StreamingResponse memakai receive() untuk deteksi disconnect
+            data = await request.body()
+
+        try:
+            rows = read_cohort_rows(data, _cohort_upload_format(content_type, filename, data))
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise HTTPException(status_code=422, detail=f"Upload tidak dapat dibaca: {e}")
+        if not rows:
+            raise HTTPException(status_code=422, detail="Roster kosong")
+        if len(rows) > COHORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Maksimal {COHORT_MAX_ROWS} baris per upload (diterima {len(rows)})",
+            )
+
+        output = (format or "").lower() or ("csv" if "text/csv" in request.headers.get("accept", "") else "ndjson")
+        if output not in ("ndjson", "csv"):
+            raise HTTPException(status_code=422, detail="format harus 'ndjson' atau 'csv'")
+
+        async def stream():
+            if output == "csv":
+                buffer = io.StringIO()
+                csv.writer(buffer).writerow(COHORT_CSV_COLUMNS)
+                yield buffer.getvalue()
+            for start in range(0, len(rows), COHORT_CHUNK_ROWS):
+                results = await run_in_threadpool(
+                    analyze_cohort_rows, rows[start:start + COHORT_CHUNK_ROWS], start + 1
+                )
+                if output == "csv":
+                    buffer = io.StringIO()
+                    csv.writer(buffer).writerows(cohort_result_csv_rows(results))
+                    yield buffer.getvalue()
+                else:
+                    yield "".join(
+                        json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n"
+                        for result in results
+                    )
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/csv; charset=utf-8" if output == "csv" else "application/x-ndjson",
+            headers={"X-Cohort-Rows": str(len(rows))},
+        )
+
+    # --- Trace referensi kurva SD (Plotly JSON) ---
+
+    @router.get("/api/charts/reference/{indicator}")
+    def charts_reference(indicator: str, sex: str = Query("M"), theme: str = Query("pink_pastel")):
+        """
+        Trace statis (zona + garis SD) satu grafik pertumbuhan. Identik untuk semua
+        anak sehingga bisa di-cache lama di klien.
+        """
+        if indicator not in GROWTH_CHART_SPECS:
+            raise HTTPException(status_code=404, detail=f"Indikator tidak dikenal: {indicator}")
+        theme = theme if theme in UI_THEMES else "pink_pastel"
+
+        return JSONResponse(
+            {
+                "indicator": indicator,
+                "sex": api_sex_code(sex),
+                "theme": theme,
+                "data": list(growth_chart_reference_traces(indicator, api_sex_code(sex), theme)),
+            },
+            headers={"Cache-Control": "public, max-age=86400"},
+        )
+
+    return router
+
+
+startup_log("✅ API module loaded")
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - CACHE MODULE
+#           Content-Addressed LRU Cache (byte budget + disk tier)
+#==============================================================================
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from modules.startup import startup_log
+
+# ==============================================================================
+# KEY UTILITIES
+# ==============================================================================
+
+def content_key(*parts: Any) -> str:
+    """
+    Hash SHA-256 dari bagian-bagian key (harus JSON-serializable)
+
+    Args:
+        *parts: Nilai yang menentukan isi cache (urutan berpengaruh)
+
+    Returns:
+        Hex digest 64 karakter
+    """
+    blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# ==============================================================================
+# LRU BYTE CACHE
+# ==============================================================================
+
+class LRUByteCache:
+    """
+    Cache LRU untuk bytes dengan batas total ukuran (bukan jumlah entri)
+
+    Tier memori dibatasi max_bytes; entri paling lama tidak dipakai dibuang
+    lebih dulu. Jika disk_dir diisi, setiap entri juga ditulis ke disk
+    ({disk_dir}/{key[:2]}/{key}) sehingga miss di memori (mis. setelah
+    restart) masih bisa dilayani dari disk lalu dipromosikan ke memori.
+    Tier disk dibatasi disk_max_bytes (0 = tanpa batas) dengan urutan LRU
+    per proses dari mtime (di-touch saat hit); isi direktori yang sudah ada
+    dipindai saat start.
+    Jika l2 diisi (modules.shared_cache), entri juga dibagi dengan worker
+    lain di host yang sama dengan key '{name}:{key}'. Thread-safe.
+    """
+
+    def __init__(self, max_bytes: int, disk_dir: Optional[str] = None, name: str = "cache",
+                 l2: Optional[Any] = None, disk_max_bytes: int = 0):
+        self.name = name
+        self.max_bytes = max(0, int(max_bytes))
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = max(0, int(disk_max_bytes))
+        self.l2 = l2
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._disk_entries: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._scan_disk()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], key)
+
+    def _scan_disk(self):
+        """Bangun indeks tier disk dari isi direktori (urut mtime) & trim ke budget"""
+        found = []
+        for root, _, files in os.walk(self.disk_dir):
+            for filename in files:
+                if filename.endswith(".tmp"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, filename))
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, filename, stat.st_size))
+        with self._lock:
+            for _, key, size in sorted(found):
+                self._disk_entries[key] = size
+                self._disk_bytes += size
+            self._trim_disk()
+
+    def _trim_disk(self):
+        """Hapus file disk paling lama tidak dipakai sampai <= disk_max_bytes (lock harus dipegang)"""
+        while self.disk_max_bytes and self._disk_bytes > self.disk_max_bytes and self._disk_entries:
+            key, size = self._disk_entries.popitem(last=False)
+            self._disk_bytes -= size
+            self.disk_evictions += 1
+            try:
+                os.remove(self._disk_path(key))
+            except OSError:
+                pass
+
+    def _store(self, key: str, value: bytes):
+        """Simpan ke tier memori & evict LRU (lock harus dipegang)"""
+        if len(value) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._entries[key] = value
+        self._bytes += len(value)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Ambil bytes untuk key (memori dulu, lalu disk, lalu tier bersama)
+
+        Returns:
+            Bytes atau None jika miss
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), "rb") as f:
+                    value = f.read()
+            except OSError:
+                value = None
+            if value is not None:
+                with self._lock:
+                    self._store(key, value)
+                    self.disk_hits += 1
+                    if key in self._disk_entries:
+                        self._disk_entries.move_to_end(key)
+                try:
+                    os.utime(self._disk_path(key))
+                except OSError:
+                    pass
+                return value
+
+        if self.l2 is not None:
+            value = self.l2.get(f"{self.name}:{key}")
+            if value is not None:
+                with self._lock:
+                    self._store(key, value)
+                    self.l2_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        """Cek key ada (memori, disk atau tier bersama) tanpa mengubah urutan LRU/statistik"""
+        with self._lock:
+            if key in self._entries:
+                return True
+        if self.disk_dir and os.path.exists(self._disk_path(key)):
+            return True
+        # Hasil worker lain di L2 juga dihitung ada (get akan mempromosikannya)
+        return self.l2 is not None and self.l2.contains(f"{self.name}:{key}")
+
+    def put(self, key: str, value: bytes):
+        """Simpan bytes untuk key (memori + disk & tier bersama jika aktif)"""
+        with self._lock:
+            self._store(key, value)
+
+        if self.l2 is not None:
+            self.l2.put(f"{self.name}:{key}", value)
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            if os.path.exists(path):
+                return
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(value)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"⚠️ {self.name}: disk write failed: {e}")
+                return
+            with self._lock:
+                if key not in self._disk_entries:
+                    self._disk_entries[key] = len(value)
+                    self._disk_bytes += len(value)
+                self._trim_disk()
+
+    def clear(self):
+        """Kosongkan tier memori (tier disk tidak disentuh)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik cache untuk endpoint metrics"""
+        with self._lock:
+            hits = self.hits + self.disk_hits + self.l2_hits
+            lookups = hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "l2_hits": self.l2_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "disk_dir": self.disk_dir,
+                "disk_bytes": self._disk_bytes,
+                "disk_max_bytes": self.disk_max_bytes,
+                "disk_evictions": self.disk_evictions,
+            }
+
+
+# ==============================================================================
+# TTL MEMO CACHE
+# ==============================================================================
+
+class TTLCache:
+    """
+    Cache LRU untuk objek Python (hasil analisis) dengan batas jumlah entri
+    dan umur maksimum per entri
+
+    Entri yang lebih tua dari ttl_seconds dianggap miss dan dibuang saat
+    dibaca; entri paling lama tidak dipakai dibuang bila jumlah entri
+    melebihi max_entries. Nilai disimpan apa adanya (tidak disalin), jadi
+    pemanggil tidak boleh mengubah objek hasil get(). Jika l2 diisi, nilai
+    (harus picklable) juga dibagi dengan worker lain dengan TTL yang sama;
+    entri L2 membawa waktu simpan aslinya sehingga hit L2 yang dipromosikan
+    ke memori hanya mendapat sisa TTL (bukan TTL penuh baru). Thread-safe.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, name: str = "memo",
+                 l2: Optional[Any] = None):
+        self.name = name
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.l2 = l2
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Ambil nilai untuk key
+
+        Returns:
+            Nilai atau None jika miss/kedaluwarsa
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.monotonic() - stored_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expired += 1
+
+        if self.l2 is not None and self.max_entries:
+            data = self.l2.get(self._l2_key(key))
+            if data is not None:
+                try:
+                    stored_wall, value = pickle.loads(data)
+                except Exception:
+                    value = None
+                age = time.time() - stored_wall if value is not None else 0.0
+                if value is not None and age <= self.ttl_seconds:
+                    with self._lock:
+                        self._store(key, value, stored_at=time.monotonic() - max(0.0, age))
+                        self.l2_hits += 1
+                    return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def discard(self, key: str):
+        """Buang entri dari memori (mis. file hasilnya sudah tidak ada)"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _l2_key(self, key: str) -> str:
+        # "v2": nilai L2 = (waktu simpan wall clock, nilai)
+        return f"{self.name}:v2:{key}"
+
+    def _store(self, key: str, value: Any, stored_at: Optional[float] = None):
+        """Simpan ke memori & evict LRU (lock harus dipegang)"""
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() if stored_at is None else stored_at, value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def put(self, key: str, value: Any):
+        """Simpan nilai untuk key & evict LRU (juga ke tier bersama jika aktif)"""
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._store(key, value)
+
+        if self.l2 is not None:
+            try:
+                data = pickle.dumps((time.time(), value), protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                print(f"⚠️ {self.name}: value not shareable: {e}")
+                return
+            self.l2.put(self._l2_key(key), data, ttl=self.ttl_seconds)
+
+    def clear(self):
+        """Kosongkan cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik cache untuk endpoint metrics"""
+        with self._lock:
+            hits = self.hits + self.l2_hits
+            lookups = hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "l2_hits": self.l2_hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+startup_log("✅ Cache module loaded")
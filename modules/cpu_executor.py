@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - CPU EXECUTOR MODULE
+#      Pool Terbatas untuk Handler CPU-bound (matplotlib, reportlab, disk)
+#==============================================================================
+
+Handler berat (analisis & grafik Kejar Tumbuh, dashboard, laporan PDF)
+dijalankan di thread pool berukuran tetap, bukan di threadpool default
+Starlette (40 thread, tanpa batas per endpoint). Tiap endpoint punya batas
+konkurensi (job berjalan + antre) dan timeout:
+  - di atas batas  → 503 + Retry-After (ditolak sebelum masuk antrean)
+  - lewat timeout  → 504; job yang belum mulai dibatalkan. Job yang sudah
+    berjalan tidak bisa dihentikan (thread Python): ia tetap memegang slot
+    endpoint & thread pool sampai selesai, jadi timeout berulang membuat
+    endpoint penuh dan request baru ditolak 503 (bukan antre tanpa batas)
+    sampai job lama selesai.
+
+Warm-up (start_warmup, mis. kurva SD yang butuh ±20-80 detik dari dingin)
+berjalan di thread terpisah saat server start; request menunggu warm-up
+selesai (paling lama CPU_WARMUP_WAIT, di luar timeout endpoint) sebelum
+masuk antrean, sehingga request pertama setelah deploy tidak menghabiskan
+timeout-nya untuk membangun kurva.
+Kedalaman antrean & penghitung per endpoint dibaca /api/metrics → cpu_executor.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.startup import startup_log
+
+CPU_EXECUTOR_WORKERS = max(1, int(os.environ.get("CPU_EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1)))))
+# Batas default per endpoint: job berjalan + antre, dan timeout (detik)
+CPU_ENDPOINT_CONCURRENCY = max(1, int(os.environ.get("CPU_ENDPOINT_CONCURRENCY", "8")))
+CPU_ENDPOINT_TIMEOUT = float(os.environ.get("CPU_ENDPOINT_TIMEOUT", "60"))
+# Override per endpoint, mis. "kejar_tumbuh_plot=2:30,report_batch=1:600"
+CPU_ENDPOINT_LIMITS = os.environ.get("CPU_ENDPOINT_LIMITS", "")
+# Batas request menunggu warm-up sebelum ditolak 503 (detik)
+CPU_WARMUP_WAIT = float(os.environ.get("CPU_WARMUP_WAIT", "180"))
+
+# Laporan batch (hingga 200 anak) jauh lebih lama dari handler lain
+DEFAULT_ENDPOINT_LIMITS: Dict[str, Tuple[int, float]] = {
+    "report_batch": (2, 300.0),
+}
+
+
+def parse_endpoint_limits(spec: str) -> Dict[str, Tuple[int, float]]:
+    """
+    Parse CPU_ENDPOINT_LIMITS → {endpoint: (konkurensi, timeout detik)}
+
+    Args:
+        spec: "nama=konkurensi[:timeout],..."; timeout kosong = CPU_ENDPOINT_TIMEOUT
+    """
+    limits = {}
+    for item in spec.split(","):
+        name, _, value = item.strip().partition("=")
+        if not name or not value:
+            continue
+        concurrency, _, timeout = value.partition(":")
+        try:
+            limits[name] = (max(1, int(concurrency)), float(timeout) if timeout else CPU_ENDPOINT_TIMEOUT)
+        except ValueError:
+            print(f"⚠️ CPU_ENDPOINT_LIMITS entry ignored: {item.strip()}")
+    return limits
+
+
+class CpuExecutor:
+    """Thread pool terbatas dengan batas konkurensi & timeout per endpoint"""
+
+    def __init__(self, workers: int, concurrency: int, timeout: float,
+                 limits: Optional[Dict[str, Tuple[int, float]]] = None):
+        """
+        Args:
+            workers: Jumlah thread pool (dibuat saat job pertama, jadi aman
+                dengan gunicorn preload: thread tidak ikut fork)
+            concurrency: Batas default job berjalan + antre per endpoint
+            timeout: Timeout default per job (detik)
+            limits: Override {endpoint: (konkurensi, timeout)}
+        """
+        self.workers = workers
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._limits = dict(limits or {})
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._warmup: Optional[Future] = None
+        self._warmup_s: Optional[float] = None
+        self._queued = 0
+        self._running = 0
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def _endpoint(self, name: str) -> Dict[str, Any]:
+        """Status endpoint (dipanggil dengan _lock dipegang)"""
+        endpoint = self._endpoints.get(name)
+        if endpoint is None:
+            limit, timeout = self._limits.get(name, (self.concurrency, self.timeout))
+            endpoint = self._endpoints[name] = {
+                "limit": limit, "timeout_s": timeout, "in_flight": 0,
+                "completed": 0, "errors": 0, "rejected": 0, "timeouts": 0,
+                "wait_s": 0.0, "run_s": 0.0,
+            }
+        return endpoint
+
+    def _call(self, endpoint: Dict[str, Any], submitted: float,
+              fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            endpoint["wait_s"] += started - submitted
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                endpoint["run_s"] += time.perf_counter() - started
+
+    def _release(self, endpoint: Dict[str, Any], future: Future):
+        with self._lock:
+            endpoint["in_flight"] -= 1
+            if future.cancelled():
+                self._queued -= 1
+            elif future.exception() is not None:
+                endpoint["errors"] += 1
+            else:
+                endpoint["completed"] += 1
+
+    def start_warmup(self, fn: Callable[[], Any]):
+        """
+        Jalankan fn di thread background; job baru menunggu fn selesai
+
+        Gagal warm-up tidak memblokir: handler lalu membangun state secara
+        lazy seperti tanpa warm-up.
+
+        Args:
+            fn: Fungsi tanpa argumen (mis. warm_growth_curves)
+        """
+        future: Future = Future()
+        future.set_running_or_notify_cancel()  # tidak bisa dibatalkan oleh request yang menunggu
+
+        def warm():
+            started = time.perf_counter()
+            try:
+                fn()
+            except Exception as e:
+                print(f"⚠️ CPU executor warm-up failed: {e}")
+            finally:
+                self._warmup_s = round(time.perf_counter() - started, 2)
+                future.set_result(None)
+
+        with self._lock:
+            self._warmup = future
+        threading.Thread(target=warm, name="cpu-warmup", daemon=True).start()
+
+    async def _wait_warmup(self, endpoint_name: str, endpoint: Dict[str, Any]):
+        """Tunggu warm-up (maks. CPU_WARMUP_WAIT); 503 jika belum selesai"""
+        warmup = self._warmup
+        if warmup is None or warmup.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(warmup)), timeout=CPU_WARMUP_WAIT)
+        except asyncio.TimeoutError:
+            with self._lock:
+                endpoint["rejected"] += 1
+            raise HTTPException(
+                status_code=503,
+                detail=f"Server masih menyiapkan data ({endpoint_name}), coba lagi sebentar.",
+                headers={"Retry-After": "10"},
+            )
+
+    async def run(self, endpoint_name: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Jalankan fn(*args, **kwargs) di pool dari handler async
+
+        Args:
+            endpoint_name: Nama endpoint untuk batas & metrik (mis. "kejar_tumbuh_plot")
+            fn: Fungsi sinkron CPU-bound; HTTPException darinya diteruskan apa adanya
+
+        Returns:
+            Hasil fn
+
+        Raises:
+            HTTPException: 503 bila batas konkurensi endpoint penuh (termasuk
+                slot yang masih dipegang job lama yang sudah 504) atau warm-up
+                belum selesai, 504 bila melewati timeout endpoint
+        """
+        with self._lock:
+            endpoint = self._endpoint(endpoint_name)
+        await self._wait_warmup(endpoint_name, endpoint)
+
+        with self._lock:
+            if endpoint["in_flight"] >= endpoint["limit"]:
+                endpoint["rejected"] += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"Server sibuk ({endpoint_name}), coba lagi sebentar.",
+                    headers={"Retry-After": "1"},
+                )
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cpu-handler")
+            endpoint["in_flight"] += 1
+            self._queued += 1
+            future = self._pool.submit(self._call, endpoint, time.perf_counter(), fn, args, kwargs)
+        future.add_done_callback(lambda done: self._release(endpoint, done))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=endpoint["timeout_s"])
+        except asyncio.TimeoutError:
+            with self._lock:
+                endpoint["timeouts"] += 1
+            raise HTTPException(
+                status_code=504,
+                detail=f"Proses {endpoint_name} melewati batas waktu {endpoint['timeout_s']:g} detik.",
+            )
+
+    def shutdown(self):
+        """Hentikan pool (shutdown server); job antre dibatalkan"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Kedalaman antrean, job berjalan & penghitung per endpoint untuk /api/metrics"""
+        with self._lock:
+            endpoints = {}
+            for name, endpoint in self._endpoints.items():
+                started = endpoint["completed"] + endpoint["errors"]
+                endpoints[name] = {
+                    key: endpoint[key]
+                    for key in ("limit", "timeout_s", "in_flight", "completed", "errors", "rejected", "timeouts")
+                }
+                endpoints[name]["avg_wait_ms"] = round(endpoint["wait_s"] / started * 1000, 1) if started else None
+                endpoints[name]["avg_run_ms"] = round(endpoint["run_s"] / started * 1000, 1) if started else None
+            warmup = self._warmup
+            return {
+                "executor": "thread",
+                "workers": self.workers,
+                "warmup": None if warmup is None else {"ready": warmup.done(), "duration_s": self._warmup_s},
+                "queue_depth": self._queued,
+                "running": self._running,
+                "endpoints": endpoints,
+            }
+
+
+cpu_executor = CpuExecutor(
+    CPU_EXECUTOR_WORKERS,
+    CPU_ENDPOINT_CONCURRENCY,
+    CPU_ENDPOINT_TIMEOUT,
+    {**DEFAULT_ENDPOINT_LIMITS, **parse_endpoint_limits(CPU_ENDPOINT_LIMITS)},
+)
+
+startup_log(f"✅ CPU executor module loaded ({CPU_EXECUTOR_WORKERS} workers)")
@@ -17,6 +17,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import FIRST_1000_DAYS_PHASES
 
+from modules.startup import startup_log
+
 # ==============================================================================
 # DATA 1000 HPK (HARI PERTAMA KEHIDUPAN)
 # ==============================================================================
@@ -504,4 +506,4 @@ def generate_1000_days_timeline() -> str:
     return html
 
 
-print("✅ First 1000 Days module loaded")
+startup_log("✅ First 1000 Days module loaded")
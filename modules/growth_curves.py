@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - GROWTH CURVES MODULE
+#        Kurva SD WHO (-3..+3), Spesifikasi Grafik & Trace Referensi Plotly
+#==============================================================================
+
+Data kurva saja (numpy): grafik matplotlib/reportlab ada di app.py, trace
+Plotly statis di sini sehingga api.py bisa menyajikannya tanpa matplotlib.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import BASE_DIR, CALC_CONFIG, BOUNDS, UI_THEMES
+from modules.shared_cache import open_shared_cache, shared_memoize
+from modules.startup import startup_log
+from modules.anthropometry import calc, _safe_z_calc
+
+# Age grid for smooth curve generation (0-60 months, step 0.25)
+AGE_GRID = np.arange(0.0, 60.25, 0.25)
+
+# -------------------------------------------------------------------------------
+# Shared cache tier (L2 lintas worker di host yang sama)
+# -------------------------------------------------------------------------------
+# lru_cache & cache in-process lain = L1 per worker; tier ini = L2 yang dibaca
+# semua worker uvicorn/gunicorn, sehingga worker dingin langsung memakai kurva,
+# grafik, laporan & hasil analisis yang sudah dihitung worker lain.
+# SHARED_CACHE_URL: sqlite:///path (default), disk:///path, atau 'off';
+# path relatif dihitung dari BASE_DIR (bukan direktori kerja)
+SHARED_CACHE_URL = os.environ.get("SHARED_CACHE_URL", "sqlite:///cache/shared_cache.sqlite3")
+SHARED_CACHE_MAX_BYTES = int(float(os.environ.get("SHARED_CACHE_MAX_MB", "256")) * 1024 * 1024)
+SHARED_CACHE_TTL = float(os.environ.get("SHARED_CACHE_TTL_HOURS", "24")) * 3600
+
+# Naikkan jika perhitungan kurva berubah (entri kurva tidak kedaluwarsa)
+CURVE_CACHE_VERSION = f"1:{CALC_CONFIG['adjust_height_data']}:{CALC_CONFIG['adjust_weight_scores']}"
+
+try:
+    shared_cache = open_shared_cache(SHARED_CACHE_URL, SHARED_CACHE_MAX_BYTES, SHARED_CACHE_TTL,
+                                     base_dir=BASE_DIR)
+except Exception as e:
+    print(f"⚠️ Shared cache disabled: {e}")
+    shared_cache = None
+
+
+def get_shared_cache():
+    """Tier L2 aktif (None jika SHARED_CACHE_URL=off atau gagal dibuka)"""
+    return shared_cache
+
+
+# ==============================================================================
+# GROWTH CURVE GENERATION
+# ==============================================================================
+
+def brentq_rootfind(f, a: float, b: float, xtol: float = 1e-6, maxiter: int = 100) -> float:
+    """
+    Brent's method for root finding (scipy-free implementation)
+    
+    Args:
+        f: Function to find root of
+        a, b: Bracket endpoints [a, b]
+        xtol: Tolerance for convergence
+        maxiter: Maximum iterations
+        
+    Returns:
+        Root approximation
+    """
+    fa = f(a)
+    fb = f(b)
+    
+    if fa is None or fb is None:
+        return (a + b) / 2.0
+    
+    if abs(fa) < 1e-10:
+        return a
+    if abs(fb) < 1e-10:
+        return b
+    
+    # Ensure bracket is valid
+    if fa * fb > 0:
+        return (a + b) / 2.0
+    
+    for iteration in range(maxiter):
+        m = 0.5 * (a + b)
+        fm = f(m)
+        
+        if fm is None:
+            return m
+        
+        if abs(fm) < 1e-10 or (b - a) / 2 < xtol:
+            return m
+        
+        if fa * fm < 0:
+            b, fb = m, fm
+        else:
+            a, fa = m, fm
+    
+    return 0.5 * (a + b)
+
+
+def invert_zscore_function(z_func, target_z: float, lo: float, hi: float, samples: int = 150) -> float:
+    """
+    Invert z-score function to find measurement value that produces target z-score
+    
+    Uses grid scan + Brent's method for robustness
+    
+    Args:
+        z_func: Function that takes measurement and returns z-score
+        target_z: Target z-score to achieve
+        lo, hi: Search bounds for measurement
+        samples: Number of grid points to scan
+        
+    Returns:
+        Measurement value that gives target_z
+    """
+    xs = np.linspace(lo, hi, samples)
+    last_x, last_f = None, None
+    best_x, best_abs = None, float('inf')
+    
+    # Grid scan phase
+    for x in xs:
+        z = z_func(x)
+        f = None if z is None else (z - target_z)
+        
+        if f is not None:
+            af = abs(f)
+            if af < best_abs:
+                best_x, best_abs = x, af
+            
+            # Check for sign change (indicates root bracket)
+            if last_f is not None and f * last_f < 0:
+                try:
+                    # Refine with Brent's method
+                    root = brentq_rootfind(
+                        lambda t: (z_func(t) or 0.0) - target_z,
+                        last_x,
+                        x,
+                        xtol=1e-5
+                    )
+                    return float(root)
+                except Exception:
+                    pass
+            
+            last_x, last_f = x, f
+    
+    # Return best approximation if no bracket found
+    return float(best_x if best_x is not None else (lo + hi) / 2.0)
+
+
+@lru_cache(maxsize=128)
+@shared_memoize(get_shared_cache, f"curve:wfa:{CURVE_CACHE_VERSION}")
+def generate_wfa_curve(sex: str, z_score: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate Weight-for-Age WHO curve for given z-score
+    
+    Args:
+        sex: 'M' or 'F'
+        z_score: Z-score line to generate (-3 to +3 typically)
+        
+    Returns:
+        Tuple of (age_array, weight_array)
+    """
+    lo, hi = BOUNDS['wfa']
+    
+    def z_func(weight, age):
+        return _safe_z_calc(calc.wfa, weight, age, sex)
+    
+    weights = []
+    for age in AGE_GRID:
+        weight = invert_zscore_function(
+            lambda w: z_func(w, age),
+            z_score,
+            lo,
+            hi
+        )
+        weights.append(weight)
+    
+    return AGE_GRID.copy(), np.array(weights)
+
+from functools import lru_cache
+
+@lru_cache(maxsize=128)
+@shared_memoize(get_shared_cache, f"curve:hfa:{CURVE_CACHE_VERSION}")
+def generate_hfa_curve(sex: str, z_score: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate Height-for-Age WHO curve for given z-score
+    
+    Args:
+        sex: 'M' or 'F'
+        z_score: Z-score line to generate
+        
+    Returns:
+        Tuple of (age_array, height_array)
+    """
+    lo, hi = BOUNDS['hfa']
+    
+    def z_func(height, age):
+        return _safe_z_calc(calc.lhfa, height, age, sex)
+    
+    heights = []
+    for age in AGE_GRID:
+        height = invert_zscore_function(
+            lambda h: z_func(h, age),
+            z_score,
+            lo,
+            hi
+        )
+        heights.append(height)
+    
+    return AGE_GRID.copy(), np.array(heights)
+
+from functools import lru_cache
+
+@lru_cache(maxsize=128)
+@shared_memoize(get_shared_cache, f"curve:hcfa:{CURVE_CACHE_VERSION}")
+def generate_hcfa_curve(sex: str, z_score: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate Head Circumference-for-Age WHO curve for given z-score
+    
+    Args:
+        sex: 'M' or 'F'
+        z_score: Z-score line to generate
+        
+    Returns:
+        Tuple of (age_array, head_circ_array)
+    """
+    lo, hi = BOUNDS['hcfa']
+    
+    def z_func(hc, age):
+        return _safe_z_calc(calc.hcfa, hc, age, sex)
+    
+    head_circs = []
+    for age in AGE_GRID:
+        hc = invert_zscore_function(
+            lambda h: z_func(h, age),
+            z_score,
+            lo,
+            hi
+        )
+        head_circs.append(hc)
+    
+    return AGE_GRID.copy(), np.array(head_circs)
+
+from functools import lru_cache
+
+@lru_cache(maxsize=128)
+@shared_memoize(get_shared_cache, f"curve:wfl:{CURVE_CACHE_VERSION}")
+def generate_wfl_curve(sex: str, age_months: float, z_score: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate Weight-for-Length WHO curve for given z-score
+    
+    Args:
+        sex: 'M' or 'F'
+        age_months: Child's age (needed for WHO calculation)
+        z_score: Z-score line to generate
+        
+    Returns:
+        Tuple of (length_array, weight_array)
+    """
+    lengths = np.arange(BOUNDS['wfl_l'][0], BOUNDS['wfl_l'][1] + 0.5, 0.5)
+    lo_w, hi_w = BOUNDS['wfl_w']
+    
+    def z_func(weight, length):
+        return _safe_z_calc(calc.wfl, weight, age_months, sex, length)
+    
+    weights = []
+    for length in lengths:
+        weight = invert_zscore_function(
+            lambda w: z_func(w, length),
+            z_score,
+            lo_w,
+            hi_w
+        )
+        weights.append(weight)
+    
+    return lengths, np.array(weights)
+
+
+# ==============================================================================
+# GROWTH CHART SPECS
+# ==============================================================================
+
+# Kurva BB/TB (wfl) tidak bergantung pada usia: pygrowup memilih tabel wfl/wfh
+# berdasarkan panjang badan saja. Memakai satu usia kanonik membuat lru_cache
+# generate_wfl_curve berlaku untuk semua anak, bukan dihitung ulang per usia.
+WFL_CURVE_AGE = 0.0
+
+# Spesifikasi grafik pertumbuhan WHO (dipakai plot_*, template cache, dll)
+# zones: (z_bawah, z_atas, warna, alpha, label)
+GROWTH_CHART_SPECS = {
+    'wfa': {
+        'z_key': 'waz',
+        'zones': [
+            (-3, -2, '#FFE6E6', 0.4, 'Gizi Buruk'),
+            (-2, -1, '#FFEBCC', 0.35, 'Gizi Kurang'),
+            (-1, 1, '#E8F5E9', 0.45, 'Normal'),
+            (1, 2, '#FFF3CD', 0.35, 'Risiko Lebih'),
+            (2, 3, '#F8D7DA', 0.4, 'Gizi Lebih'),
+        ],
+        'ylim_bottom': 0,
+    },
+    'hfa': {
+        'z_key': 'haz',
+        'zones': [
+            (-3, -2, '#FFE6E6', 0.4, 'Sangat Pendek'),
+            (-2, -1, '#FFEBCC', 0.35, 'Pendek'),
+            (-1, 1, '#E8F5E9', 0.45, 'Normal'),
+            (1, 2, '#FFF3CD', 0.35, 'Tinggi'),
+        ],
+        'ylim_bottom': 40,
+    },
+    'hcfa': {
+        'z_key': 'hcz',
+        'zones': [
+            (-3, -2, '#FFE6E6', 0.4, 'Mikrosefali'),
+            (-2, 2, '#E8F5E9', 0.45, 'Normal'),
+            (2, 3, '#FFE6E6', 0.4, 'Makrosefali'),
+        ],
+        'ylim_bottom': 28,
+    },
+    'wfl': {
+        'z_key': 'whz',
+        'zones': [
+            (-3, -2, '#FFE6E6', 0.4, 'Gizi Buruk'),
+            (-2, -1, '#FFEBCC', 0.35, 'Gizi Kurang'),
+            (-1, 1, '#E8F5E9', 0.45, 'Normal'),
+            (1, 2, '#FFF3CD', 0.35, 'Risiko Lebih'),
+            (2, 3, '#F8D7DA', 0.4, 'Gizi Lebih'),
+        ],
+        'ylim_bottom': 0,
+    },
+}
+
+
+def _sd_line_styles(theme: Dict[str, str]) -> Dict[int, Tuple[str, str, float]]:
+    """Warna, linestyle dan linewidth garis SD -3..+3"""
+    return {
+        -3: ('#DC143C', '-', 2.0),  # Dark red, solid
+        -2: ('#FF6347', '-', 2.5),  # Tomato, solid
+        -1: (theme['primary'], '--', 1.5),  # Theme color, dashed
+        0: (theme['secondary'], '-', 2.5),  # Median, solid, thick
+        1: (theme['primary'], '--', 1.5),  # Theme color, dashed
+        2: ('#FF6347', '-', 2.5),  # Tomato, solid
+        3: ('#DC143C', '-', 2.0)   # Dark red, solid
+    }
+
+
+def growth_chart_curves(indicator: str, sex: str) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Ambil kurva SD -3..+3 untuk satu indikator (dari lru_cache generate_*_curve)
+    
+    Args:
+        indicator: 'wfa', 'hfa', 'hcfa' atau 'wfl'
+        sex: 'M' or 'F'
+        
+    Returns:
+        Dict {z: (x_array, y_array)}
+    """
+    if indicator == 'wfa':
+        return {z: generate_wfa_curve(sex, z) for z in range(-3, 4)}
+    if indicator == 'hfa':
+        return {z: generate_hfa_curve(sex, z) for z in range(-3, 4)}
+    if indicator == 'hcfa':
+        return {z: generate_hcfa_curve(sex, z) for z in range(-3, 4)}
+    if indicator == 'wfl':
+        return {z: generate_wfl_curve(sex, WFL_CURVE_AGE, z) for z in range(-3, 4)}
+    raise ValueError(f"Unknown growth chart indicator: {indicator}")
+
+
+def growth_chart_table(indicator: str, age_mo: float) -> str:
+    """
+    Nama tabel WHO yang menentukan label grafik (panjang vs tinggi badan)
+    
+    Args:
+        indicator: 'wfa', 'hfa', 'hcfa' atau 'wfl'
+        age_mo: Usia anak (bulan)
+        
+    Returns:
+        Nama tabel, misal 'lhfa_0_2' atau 'wfh_2_5'
+    """
+    if indicator == 'hfa':
+        return 'lhfa_0_2' if age_mo < 24 else 'lhfa_2_5'
+    if indicator == 'wfl':
+        return 'wfl_0_2' if age_mo < 24 else 'wfh_2_5'
+    return f"{indicator}_0_5"
+
+
+def warm_growth_curves(sexes: Tuple[str, ...] = ('M', 'F')):
+    """Isi lru_cache semua kurva SD (-3..+3) untuk BB/U, TB/U, LK/U, BB/TB"""
+    for sex in sexes:
+        for indicator in GROWTH_CHART_SPECS:
+            growth_chart_curves(indicator, sex)
+
+
+# ==============================================================================
+# REFERENCE TRACES (PLOTLY JSON)
+# ==============================================================================
+
+# Presisi koordinat kurva di JSON (0.01 kg/cm sudah jauh di bawah resolusi layar)
+CHART_SPEC_DECIMALS = 2
+
+_PLOTLY_DASH = {'-': 'solid', '--': 'dash', ':': 'dot', '-.': 'dashdot'}
+
+
+def _hex_to_rgba(color: str, alpha: float) -> str:
+    """'#RRGGBB' + alpha → 'rgba(r, g, b, a)' untuk fillcolor Plotly"""
+    color = color.lstrip('#')
+    r, g, b = (int(color[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+def _spec_values(values: np.ndarray) -> List[float]:
+    return np.round(np.asarray(values, dtype=float), CHART_SPEC_DECIMALS).tolist()
+
+
+@lru_cache(maxsize=48)
+def growth_chart_reference_traces(indicator: str, sex: str, theme_name: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    Trace Plotly statis (zona status gizi + 7 garis SD) per indikator/jenis kelamin/tema
+    
+    Di-cache karena identik untuk semua anak; jangan dimutasi oleh pemanggil.
+    
+    Returns:
+        Tuple dict trace Plotly
+    """
+    theme = UI_THEMES.get(theme_name, UI_THEMES["pink_pastel"])
+    spec = GROWTH_CHART_SPECS[indicator]
+    curves = growth_chart_curves(indicator, sex)
+    x = _spec_values(curves[0][0])
+    traces = []
+    
+    for z_lo, z_hi, color, alpha, label in spec['zones']:
+        traces.append({
+            'type': 'scatter', 'mode': 'lines',
+            'x': x, 'y': _spec_values(curves[z_lo][1]),
+            'line': {'width': 0},
+            'hoverinfo': 'skip',
+            'showlegend': False,
+            'legendgroup': label,
+        })
+        traces.append({
+            'type': 'scatter', 'mode': 'lines',
+            'x': x, 'y': _spec_values(curves[z_hi][1]),
+            'line': {'width': 0},
+            'fill': 'tonexty',
+            'fillcolor': _hex_to_rgba(color, alpha),
+            'name': label,
+            'hoverinfo': 'skip',
+            'legendgroup': label,
+        })
+    
+    for z, (color, linestyle, linewidth) in _sd_line_styles(theme).items():
+        name = "Median (WHO)" if z == 0 else f"{z:+d} SD"
+        traces.append({
+            'type': 'scatter', 'mode': 'lines',
+            'x': x, 'y': _spec_values(curves[z][1]),
+            'line': {'color': color, 'dash': _PLOTLY_DASH[linestyle], 'width': linewidth},
+            'opacity': 0.9,
+            'name': name,
+            'hovertemplate': f"{name}: %{{y:.1f}}<extra></extra>",
+        })
+    
+    return tuple(traces)
+
+
+startup_log("✅ Growth curves module loaded")
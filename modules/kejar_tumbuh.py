@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - KEJAR TUMBUH MODULE
+#           Analisis Laju Pertumbuhan (Growth Velocity) - HTML saja
+#==============================================================================
+
+Grafik trajektori (matplotlib) tetap di app.py: plot_kejar_tumbuh_trajectory.
+"""
+
+from typing import Dict, List
+
+from modules.startup import startup_log
+
+
+def hitung_kejar_tumbuh(data_state: List[Dict]) -> str:
+    """
+    Menghitung laju pertumbuhan dari data yang sudah diinput
+    
+    Args:
+        data_state: List data pengukuran
+    
+    Returns:
+        HTML report dengan analisis laju pertumbuhan
+    """
+    if not data_state or len(data_state) < 2:
+        return "<p style='color: #e74c3c; padding: 20px;'>⚠️ Minimal 2 data pengukuran diperlukan untuk menghitung laju pertumbuhan.</p>"
+    
+    # Hitung velocity
+    results = []
+    for i in range(len(data_state) - 1):
+        data1 = data_state[i]
+        data2 = data_state[i + 1]
+        
+        delta_months = data2['usia_bulan'] - data1['usia_bulan']
+        delta_bb = data2['bb'] - data1['bb']
+        delta_tb = data2['tb'] - data1['tb']
+        
+        if delta_months > 0:
+            velocity_bb = delta_bb / delta_months  # kg/bulan
+            velocity_tb = delta_tb / delta_months  # cm/bulan
+            
+            results.append({
+                'periode': f"{data1['usia_bulan']:.1f} - {data2['usia_bulan']:.1f} bulan",
+                'delta_months': delta_months,
+                'velocity_bb': velocity_bb,
+                'velocity_tb': velocity_tb,
+                'delta_bb': delta_bb,
+                'delta_tb': delta_tb
+            })
+    
+    if not results:
+        return "<p style='color: #e74c3c; padding: 20px;'>⚠️ Data tidak memadai untuk menghitung laju pertumbuhan (perlu interval waktu positif).</p>"
+
+    # Generate HTML report
+    html = "<div style='padding: 20px; background: white; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);'>"
+    html += "<h3 style='color: #2c3e50; margin-top: 0;'>📈 Analisis Laju Pertumbuhan (Growth Velocity)</h3>"
+    
+    html += "<table style='width: 100%; border-collapse: collapse; margin: 20px 0;'>"
+    html += "<tr style='background: #3498db; color: white;'>"
+    html += "<th style='padding: 10px; border: 1px solid #ddd;'>Periode</th>"
+    html += "<th style='padding: 10px; border: 1px solid #ddd;'>Durasi</th>"
+    html += "<th style='padding: 10px; border: 1px solid #ddd;'>Δ BB</th>"
+    html += "<th style='padding: 10px; border: 1px solid #ddd;'>Velocity BB</th>"
+    html += "<th style='padding: 10px; border: 1px solid #ddd;'>Δ TB</th>"
+    html += "<th style='padding: 10px; border: 1px solid #ddd;'>Velocity TB</th>"
+    html += "<th style='padding: 10px; border: 1px solid #ddd;'>Status</th>"
+    html += "</tr>"
+    
+    for i, result in enumerate(results):
+        bg_color = "#ecf0f1" if i % 2 == 0 else "#ffffff"
+        
+        # Evaluasi velocity BB (rule of thumb: 0.5-1 kg/bulan untuk bayi)
+        if result['velocity_bb'] < 0:
+            bb_status = "⚠️ Penurunan"
+            bb_color = "#e74c3c"
+        elif result['velocity_bb'] < 0.3:
+            bb_status = "⚠️ Lambat"
+            bb_color = "#f39c12"
+        elif result['velocity_bb'] <= 1.5:
+            bb_status = "✅ Normal"
+            bb_color = "#27ae60"
+        else:
+            bb_status = "ℹ️ Cepat"
+            bb_color = "#3498db"
+        
+        # Evaluasi velocity TB (rule of thumb: 2-3 cm/bulan untuk bayi)
+        if result['velocity_tb'] < 0:
+            tb_status = "⚠️ Penurunan"
+            tb_color = "#e74c3c"
+        elif result['velocity_tb'] < 1:
+            tb_status = "⚠️ Lambat"
+            tb_color = "#f39c12"
+        elif result['velocity_tb'] <= 4:
+            tb_status = "✅ Normal"
+            tb_color = "#27ae60"
+        else:
+            tb_status = "ℹ️ Cepat"
+            tb_color = "#3498db"
+        
+        overall_status = "✅ Baik" if "✅" in bb_status and "✅" in tb_status else "⚠️ Perlu Perhatian"
+        overall_color = "#27ae60" if "✅" in overall_status else "#f39c12"
+        
+        html += f"<tr style='background: {bg_color};'>"
+        html += f"<td style='padding: 10px; border: 1px solid #ddd;'>{result['periode']}</td>"
+        html += f"<td style='padding: 10px; border: 1px solid #ddd; text-align: center;'>{result['delta_months']:.1f} bln</td>"
+        html += f"<td style='padding: 10px; border: 1px solid #ddd; text-align: center;'>{result['delta_bb']:+.2f} kg</td>"
+        html += f"<td style='padding: 10px; border: 1px solid #ddd; text-align: center; color: {bb_color}; font-weight: bold;'>{result['velocity_bb']:.2f} kg/bln<br><small>{bb_status}</small></td>"
+        html += f"<td style='padding: 10px; border: 1px solid #ddd; text-align: center;'>{result['delta_tb']:+.1f} cm</td>"
+        html += f"<td style='padding: 10px; border: 1px solid #ddd; text-align: center; color: {tb_color}; font-weight: bold;'>{result['velocity_tb']:.2f} cm/bln<br><small>{tb_status}</small></td>"
+        html += f"<td style='padding: 10px; border: 1px solid #ddd; text-align: center; color: {overall_color}; font-weight: bold;'>{overall_status}</td>"
+        html += "</tr>"
+    
+    html += "</table>"
+    
+    # Summary statistics
+    avg_velocity_bb = sum(r['velocity_bb'] for r in results) / len(results)
+    avg_velocity_tb = sum(r['velocity_tb'] for r in results) / len(results)
+    
+    html += "<div style='background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 20px;'>"
+    html += "<h4 style='color: #2c3e50; margin-top: 0;'>📊 Rata-rata Laju Pertumbuhan</h4>"
+    html += f"<p><strong>Berat Badan:</strong> {avg_velocity_bb:.2f} kg/bulan</p>"
+    html += f"<p><strong>Tinggi Badan:</strong> {avg_velocity_tb:.2f} cm/bulan</p>"
+    html += "</div>"
+    
+    html += "<div style='background: #fff3cd; padding: 15px; border-radius: 8px; margin-top: 15px; border-left: 4px solid #ffc107;'>"
+    html += "<p style='margin: 0;'><strong>ℹ️ Catatan:</strong> Interpretasi ini bersifat umum. Konsultasikan dengan dokter anak untuk evaluasi yang lebih akurat.</p>"
+    html += "</div>"
+    
+    html += "</div>"
+    
+    return html
+
+
+startup_log("✅ Kejar Tumbuh module loaded")
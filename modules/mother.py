@@ -11,6 +11,8 @@ from typing import Dict, List, Optional
 from datetime import date, datetime
 import math
 
+from modules.startup import startup_log
+
 # ==============================================================================
 # DATA KEBUTUHAN GIZI IBU
 # ==============================================================================
@@ -574,4 +576,4 @@ def generate_mental_health_html() -> str:
     return html
 
 
-print("✅ Mother module loaded")
+startup_log("✅ Mother module loaded")
@@ -24,6 +24,8 @@ from data.mpasi_guide import (
 )
 from config import MPASI_YOUTUBE_VIDEOS
 
+from modules.startup import startup_log
+
 # ==============================================================================
 # MPASI TAB CONTENT GENERATORS
 # ==============================================================================
@@ -374,4 +376,4 @@ def generate_recipes_html(month: int) -> str:
     return html
 
 
-print("✅ MPASI module loaded")
+startup_log("✅ MPASI module loaded")
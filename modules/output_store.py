@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - OUTPUT STORE MODULE
+#        Content-Addressed File Store (dedup + TTL/size eviction sweeper)
+#==============================================================================
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from modules.startup import startup_log
+
+# Direktori shard 2 karakter hex (dipertahankan walau kosong)
+_SHARD_RE = re.compile(r"^[0-9a-f]{2}$")
+
+# ==============================================================================
+# OUTPUT STORE
+# ==============================================================================
+
+class OutputStore:
+    """
+    Penyimpanan file hasil (grafik, kartu, PDF, CSV) dengan nama = hash isi
+
+    Bytes identik ditulis sekali: {root}/{hash[:2]}/{hash}.{ext}. File yang
+    perlu nama download (PDF/CSV) disimpan sebagai
+    {root}/{hash[:2]}/{hash[:32]}/{name}.{ext}, dengan name ikut di-hash
+    supaya nama anak lain tidak pernah muncul pada file milik anak ini.
+    Karena isi file tidak pernah berubah untuk path yang sama, file aman
+    di-cache selamanya oleh klien (immutable).
+
+    Sweeper menghapus file yang lebih tua dari ttl_seconds (umur dihitung
+    dari penulisan/dedup terakhir), lalu file paling lama bila total ukuran
+    melebihi max_bytes. File lama di luar shard (mis. file datar
+    {root}/PeduliGizi_*.pdf dari versi sebelum store content-addressed,
+    atau outputs/chart_cache) ikut disapu dengan aturan yang sama, karena
+    semua penulisan ke root kini lewat put(). Thread-safe.
+    """
+
+    def __init__(self, root: str, max_bytes: int, ttl_seconds: float, name: str = "output_store"):
+        self.name = name
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        self.writes = 0
+        self.bytes_written = 0
+        self.dedup_hits = 0
+        self.bytes_saved = 0
+        self.evicted_files = 0
+        self.evicted_bytes = 0
+        self.sweeps = 0
+        self.last_sweep: Optional[Dict[str, Any]] = None
+
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, data: bytes, ext: str, name: Optional[str] = None) -> str:
+        """Path content-addressed untuk bytes (tanpa menulis)"""
+        digest = hashlib.sha256(data)
+        if name:
+            digest.update(b"\0" + name.encode("utf-8"))
+            key = digest.hexdigest()
+            return os.path.join(self.root, key[:2], key[:32], f"{name}.{ext}")
+        key = digest.hexdigest()
+        return os.path.join(self.root, key[:2], f"{key}.{ext}")
+
+    def put(self, data: bytes, ext: str, name: Optional[str] = None) -> str:
+        """
+        Simpan bytes (sekali per isi) dan kembalikan path-nya
+
+        Args:
+            data: Isi file
+            ext: Ekstensi tanpa titik ('png', 'pdf', ...)
+            name: Nama file download tanpa ekstensi (opsional)
+
+        Returns:
+            Filepath di bawah root
+        """
+        path = self.path_for(data, ext, name)
+        if os.path.exists(path):
+            try:
+                # Perbarui umur file: dedup dihitung sebagai pemakaian terbaru
+                os.utime(path)
+            except OSError:
+                pass
+            with self._lock:
+                self.dedup_hits += 1
+                self.bytes_saved += len(data)
+            return path
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.writes += 1
+            self.bytes_written += len(data)
+        return path
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """(mtime, ukuran, path) semua file di bawah root: shard, subdirektori nama & file lama"""
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _remove(self, path: str):
+        """Hapus file & direktori induk yang jadi kosong (bukan shard, bukan root)"""
+        os.remove(path)
+        root = os.path.abspath(self.root)
+        parent = os.path.abspath(os.path.dirname(path))
+        while parent != root and not (os.path.dirname(parent) == root
+                                      and _SHARD_RE.match(os.path.basename(parent))):
+            try:
+                os.rmdir(parent)
+            except OSError:
+                break
+            parent = os.path.dirname(parent)
+
+    def sweep(self) -> Dict[str, Any]:
+        """
+        Satu putaran eviction: TTL dulu, lalu batas ukuran (file tertua dulu)
+
+        Returns:
+            Ringkasan putaran (file/bytes dihapus, sisa file/bytes)
+        """
+        started = time.time()
+        entries = sorted(self._entries())
+        cutoff = started - self.ttl_seconds if self.ttl_seconds else None
+        total = sum(size for _, size, _ in entries)
+        removed_files = removed_bytes = 0
+
+        for mtime, size, path in entries:
+            expired = cutoff is not None and mtime < cutoff
+            if not expired and total <= self.max_bytes:
+                break
+            try:
+                self._remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed_files += 1
+            removed_bytes += size
+
+        summary = {
+            "at": started,
+            "duration_ms": round((time.time() - started) * 1000, 1),
+            "removed_files": removed_files,
+            "removed_bytes": removed_bytes,
+            "files": len(entries) - removed_files,
+            "bytes": total,
+        }
+        with self._lock:
+            self.evicted_files += removed_files
+            self.evicted_bytes += removed_bytes
+            self.sweeps += 1
+            self.last_sweep = summary
+        return summary
+
+    def _sweep_loop(self, interval: float):
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"⚠️ {self.name}: sweep failed: {e}")
+            if self._stop.wait(interval):
+                return
+
+    def start_sweeper(self, interval: float):
+        """Sweep sekarang lalu tiap interval detik, di thread daemon"""
+        with self._lock:
+            if self._sweeper is not None and self._sweeper.is_alive():
+                return
+            self._stop.clear()
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, args=(interval,), name=f"{self.name}-sweeper", daemon=True
+            )
+            self._sweeper.start()
+
+    def stop_sweeper(self):
+        """Hentikan thread sweeper (dipanggil saat shutdown)"""
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik store untuk endpoint metrics"""
+        with self._lock:
+            puts = self.writes + self.dedup_hits
+            return {
+                "name": self.name,
+                "root": self.root,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "writes": self.writes,
+                "bytes_written": self.bytes_written,
+                "dedup_hits": self.dedup_hits,
+                "dedup_rate": round(self.dedup_hits / puts, 4) if puts else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "evicted_files": self.evicted_files,
+                "evicted_bytes": self.evicted_bytes,
+                "sweeps": self.sweeps,
+                "last_sweep": self.last_sweep,
+            }
+
+
+startup_log("✅ Output store module loaded")
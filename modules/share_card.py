@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - SHARE CARD MODULE
+#           Kartu Ringkasan Status Gizi (Pillow, tanpa matplotlib)
+#==============================================================================
+"""
+
+import importlib.util
+import io
+import math
+import os
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import BASE_URL, STATIC_DIR, UI_THEMES
+
+from modules.startup import startup_log
+
+# ==============================================================================
+# CONFIGURATION
+# ==============================================================================
+
+# Rasio 4:5 (pratinjau penuh di WhatsApp/Instagram) dengan piksel secukupnya
+SHARE_CARD_SIZE = (720, 900)
+
+# Baris kartu: (kunci z-score, label indeks)
+SHARE_CARD_ROWS = [
+    ('waz', 'BB/U'),
+    ('haz', 'TB/U'),
+    ('whz', 'BB/TB'),
+    ('baz', 'IMT/U'),
+    ('hcz', 'LK/U'),
+]
+
+# Codec kartu. 'png' = PNG palette (kartu berwarna datar: kuantisasi ke palet
+# tetap per tema + encode 1 byte/piksel jauh lebih murah dari PNG/WebP RGB)
+SHARE_CARD_FORMATS = {
+    'png': {'mime': 'image/png', 'ext': 'png', 'pil_format': 'PNG', 'pil_kwargs': {'compress_level': 1}},
+    'webp': {'mime': 'image/webp', 'ext': 'webp', 'pil_format': 'WEBP', 'pil_kwargs': {'quality': 90, 'method': 0}},
+}
+SHARE_CARD_PALETTE_COLORS = 96
+
+_MUTED = "#95a5a6"
+
+# ==============================================================================
+# FONTS
+# ==============================================================================
+
+def _font_dirs() -> List[str]:
+    """
+    Direktori font TTF: SHARE_CARD_FONT_DIR, static/fonts, lalu DejaVu bawaan
+    paket matplotlib (dicari lewat find_spec, matplotlib tidak di-import)
+    """
+    dirs = [os.environ.get("SHARE_CARD_FONT_DIR", ""), os.path.join(STATIC_DIR, "fonts")]
+    spec = importlib.util.find_spec("matplotlib")
+    if spec is not None and spec.submodule_search_locations:
+        dirs.append(os.path.join(list(spec.submodule_search_locations)[0], "mpl-data", "fonts", "ttf"))
+    return [d for d in dirs if d and os.path.isdir(d)]
+
+
+@lru_cache(maxsize=16)
+def _font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    """DejaVu Sans (bold) ukuran tertentu; fallback ke font bawaan Pillow"""
+    filename = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
+    for directory in _font_dirs():
+        path = os.path.join(directory, filename)
+        if os.path.exists(path):
+            return ImageFont.truetype(path, size)
+    return ImageFont.load_default(size=size)
+
+
+# ==============================================================================
+# HELPERS
+# ==============================================================================
+
+def _is_valid(z: Optional[float]) -> bool:
+    return z is not None and not (isinstance(z, float) and math.isnan(z))
+
+
+def severity_color(z: Optional[float]) -> str:
+    """
+    Warna tingkat keparahan z-score (sama dengan grafik ringkasan z-score)
+
+    Args:
+        z: Z-score atau None
+
+    Returns:
+        Hex color
+    """
+    if not _is_valid(z):
+        return _MUTED
+    if abs(z) > 3:
+        return '#8B0000'  # Dark red
+    if abs(z) > 2:
+        return '#DC143C'  # Red
+    if abs(z) > 1:
+        return '#FFA500'  # Orange
+    return '#28a745'  # Green
+
+
+def _format_z(z: Optional[float]) -> str:
+    return f"{z:+.2f}" if _is_valid(z) else "—"
+
+
+def _fit_text(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> str:
+    """Potong teks dengan '…' agar muat di max_width piksel (keterangan dalam kurung dibuang dulu)"""
+    if draw.textlength(text, font=font) <= max_width:
+        return text
+    if " (" in text:
+        return _fit_text(draw, text.split(" (")[0], font, max_width)
+    while text and draw.textlength(text + "…", font=font) > max_width:
+        text = text[:-1]
+    return text.rstrip() + "…"
+
+
+def _age_text(age_mo: Optional[float]) -> str:
+    """'14.0 bulan (1 th 2 bl)'"""
+    if age_mo is None:
+        return "Usia tidak diketahui"
+    years, months = divmod(int(age_mo), 12)
+    if years:
+        return f"{age_mo:.1f} bulan ({years} th {months} bl)"
+    return f"{age_mo:.1f} bulan"
+
+
+def _measurement_text(payload: Dict[str, Any]) -> str:
+    parts = []
+    for key, label, unit in (('w', 'BB', 'kg'), ('h', 'TB', 'cm'), ('hc', 'LK', 'cm')):
+        value = payload.get(key)
+        if value is not None:
+            parts.append(f"{label} {value:.1f} {unit}")
+    return "  •  ".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def _text_mask(text: str, size: int, bold: bool = False,
+               max_width: Optional[int] = None) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Rasterisasi teks (mask 'L') sekali untuk teks yang sering berulang
+    (z-score, kategori Permenkes); dipotong agar muat di max_width
+
+    Returns:
+        Tuple (mask, offset (left, top) relatif terhadap titik anchor kiri-atas)
+    """
+    font = _font(size, bold)
+    if max_width is not None:
+        text = _fit_text(ImageDraw.Draw(Image.new("L", (1, 1))), text, font, max_width)
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+
+def _stamp_text(image: Image.Image, xy: Tuple[int, int], text: str, size: int, fill: str,
+                bold: bool = False, max_width: Optional[int] = None, center: bool = False):
+    """Tempel teks dari cache _text_mask (center=True: xy adalah titik tengah)"""
+    mask, (left, top) = _text_mask(text, size, bold, max_width)
+    x, y = xy
+    if center:
+        x, y = x - mask.width // 2, y - mask.height // 2
+    else:
+        x, y = x + left, y + top
+    image.paste(ImageColor.getrgb(fill), (x, y, x + mask.width, y + mask.height), mask)
+
+
+# ==============================================================================
+# CARD RENDERING
+# ==============================================================================
+
+@lru_cache(maxsize=8)
+def _card_background(theme_name: str) -> Image.Image:
+    """
+    Bagian statis kartu per tema (header, kotak baris, judul kolom, footer)
+
+    Di-cache; setiap kartu hanya menyalin gambar ini lalu menulis teks anak.
+    """
+    theme = UI_THEMES.get(theme_name, UI_THEMES["pink_pastel"])
+    width, height = SHARE_CARD_SIZE
+    image = Image.new("RGB", SHARE_CARD_SIZE, theme["bg"])
+    draw = ImageDraw.Draw(image)
+
+    # Header
+    draw.rectangle([0, 0, width, 120], fill=theme["primary"])
+    draw.text((40, 30), "Ringkasan Status Gizi", font=_font(34, bold=True), fill="white")
+    draw.text((40, 78), "AnthroHPK • WHO 2006 & Permenkes RI No. 2/2020", font=_font(18), fill="white")
+
+    # Kartu identitas & tabel
+    draw.rounded_rectangle([24, 144, width - 24, 300], radius=18, fill=theme["card"], outline=theme["border"], width=2)
+    draw.rounded_rectangle([24, 324, width - 24, 800], radius=18, fill=theme["card"], outline=theme["border"], width=2)
+
+    header_font = _font(17, bold=True)
+    draw.text((48, 344), "Indeks", font=header_font, fill=_MUTED)
+    draw.text((170, 344), "Z-Score", font=header_font, fill=_MUTED)
+    draw.text((310, 344), "Kategori (Permenkes 2020)", font=header_font, fill=_MUTED)
+    for i, (_, label) in enumerate(SHARE_CARD_ROWS):
+        top = 384 + i * 84
+        draw.text((48, top + 24), label, font=_font(22, bold=True), fill=theme["text"])
+        if i:
+            draw.line([48, top - 8, width - 48, top - 8], fill=theme["border"], width=1)
+
+    # Footer
+    draw.text((40, 822), "Hasil skrining, bukan diagnosis. Konsultasikan dengan tenaga kesehatan.",
+              font=_font(15), fill=theme["text"])
+    draw.text((40, 852), BASE_URL.replace("https://", ""), font=_font(15, bold=True), fill=theme["primary"])
+
+    return image
+
+
+def render_share_card(payload: Dict[str, Any], theme_name: Optional[str] = None) -> Image.Image:
+    """
+    Gambar kartu ringkasan dari payload run_comprehensive_analysis
+
+    Args:
+        payload: Payload analisis (name_child, sex/sex_text, age_mo, w, h, hc,
+            z, permenkes, dom)
+        theme_name: Nama tema (default payload['theme'] atau pink_pastel)
+
+    Returns:
+        PIL Image (RGB, SHARE_CARD_SIZE)
+    """
+    theme_name = theme_name or payload.get('theme') or "pink_pastel"
+    theme = UI_THEMES.get(theme_name, UI_THEMES["pink_pastel"])
+    width, _ = SHARE_CARD_SIZE
+
+    image = _card_background(theme_name).copy()
+    draw = ImageDraw.Draw(image)
+
+    # Identitas anak
+    name = _fit_text(draw, payload.get('name_child') or "Si Kecil", _font(32, bold=True), width - 96)
+    draw.text((48, 164), name, font=_font(32, bold=True), fill=theme["text"])
+
+    sex_text = payload.get('sex_text') or ("Laki-laki" if payload.get('sex') == 'M' else "Perempuan")
+    draw.text((48, 212), f"{sex_text}  •  {_age_text(payload.get('age_mo'))}", font=_font(20), fill=theme["text"])
+
+    details = _measurement_text(payload)
+    if payload.get('dom'):
+        details = f"{details}  •  {payload['dom']}" if details else str(payload['dom'])
+    draw.text((48, 250), _fit_text(draw, details, _font(18), width - 96), font=_font(18), fill=_MUTED)
+
+    # Lima indeks: z-score berwarna + kategori Permenkes
+    z_scores = payload.get('z') or {}
+    categories = payload.get('permenkes') or {}
+
+    for i, (key, _) in enumerate(SHARE_CARD_ROWS):
+        top = 384 + i * 84
+        z = z_scores.get(key)
+        color = severity_color(z)
+
+        draw.rounded_rectangle([164, top + 14, 284, top + 62], radius=24, fill=color)
+        _stamp_text(image, (224, top + 38), _format_z(z), 22, "white", bold=True, center=True)
+
+        category = categories.get(key) or ("Data Tidak Tersedia" if not _is_valid(z) else "")
+        if category:
+            _stamp_text(image, (310, top + 26), category, 18, color, max_width=width - 48 - 310)
+
+    return image
+
+
+@lru_cache(maxsize=8)
+def _card_palette(theme_name: str) -> Image.Image:
+    """
+    Palet tetap per tema (gambar mode 'P') dari kartu contoh yang memuat semua
+    warna keparahan, sehingga tepi teks anti-aliased ikut terwakili
+    """
+    sample = {
+        'name_child': "Contoh Nama Anak",
+        'sex': 'M',
+        'age_mo': 30.0,
+        'w': 12.0, 'h': 88.0, 'hc': 48.0,
+        'dom': "2025-01-01",
+        'z': {'waz': -3.5, 'haz': -2.5, 'whz': -1.5, 'baz': 0.0, 'hcz': None},
+        'permenkes': {
+            'waz': "Berat Badan Sangat Kurang",
+            'haz': "Pendek (Stunted)",
+            'whz': "Gizi Baik (Normal)",
+            'baz': "Gizi Baik (Normal)",
+        },
+    }
+    return render_share_card(sample, theme_name).quantize(
+        SHARE_CARD_PALETTE_COLORS, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE
+    )
+
+
+def share_card_bytes(payload: Dict[str, Any], theme_name: Optional[str] = None, fmt: str = "png") -> bytes:
+    """
+    Kartu ringkasan ter-encode
+
+    Args:
+        payload: Payload analisis (lihat render_share_card)
+        theme_name: Nama tema (opsional)
+        fmt: 'png' (palette, default) atau 'webp'
+
+    Returns:
+        Image bytes
+    """
+    theme_name = theme_name or payload.get('theme') or "pink_pastel"
+    if theme_name not in UI_THEMES:
+        theme_name = "pink_pastel"
+    spec = SHARE_CARD_FORMATS.get(fmt, SHARE_CARD_FORMATS['png'])
+
+    image = render_share_card(payload, theme_name)
+    if spec['pil_format'] == 'PNG':
+        image = image.quantize(palette=_card_palette(theme_name), dither=Image.Dither.NONE)
+
+    buf = io.BytesIO()
+    image.save(buf, format=spec['pil_format'], **spec['pil_kwargs'])
+    return buf.getvalue()
+
+
+startup_log("✅ Share card module loaded")
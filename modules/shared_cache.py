@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - SHARED CACHE MODULE
+#        Cache L2 lintas worker satu host (SQLite atau direktori disk)
+#==============================================================================
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from modules.startup import startup_log
+
+# Sentinel: pakai TTL default instance
+_DEFAULT_TTL = object()
+
+# Pangkas ukuran tiap N put (bukan setiap put: trim = scan tabel)
+_TRIM_EVERY = 64
+
+# Resolusi waktu akses LRU SQLite (detik): hit memperbarui accessed hanya
+# bila nilai lama lebih tua dari ini
+_TOUCH_INTERVAL = 60
+
+
+# ==============================================================================
+# BACKEND SQLITE
+# ==============================================================================
+
+class SQLiteSharedCache:
+    """
+    Key → bytes di satu file SQLite (mode WAL) yang dibaca & ditulis semua
+    worker di host yang sama
+
+    Entri punya waktu kedaluwarsa (ttl_seconds, None = tidak pernah);
+    bila total ukuran melebihi max_bytes, entri paling lama tidak dibaca
+    dibuang lebih dulu (LRU: kolom accessed diperbarui saat hit, paling
+    sering sekali per _TOUCH_INTERVAL agar get tidak selalu menulis). Koneksi dibuat per thread & per proses (aman
+    setelah fork). Error SQLite (disk penuh, lock terlalu lama) dianggap
+    miss: tier ini hanya mempercepat, tidak pernah menggagalkan request.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, max_bytes: int, ttl_seconds: Optional[float], name: str = "shared_cache"):
+        self.name = name
+        self.path = path
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        self.puts_since_trim = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+                " stored REAL NOT NULL, expires REAL, accessed REAL)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            if "accessed" not in columns:
+                # File cache lama (urutan trim = stored)
+                conn.execute("ALTER TABLE entries ADD COLUMN accessed REAL")
+                conn.execute("UPDATE entries SET accessed = stored")
+            conn.execute("DROP INDEX IF EXISTS entries_stored")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Koneksi milik thread & proses ini"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _error(self, action: str, e: Exception):
+        with self._lock:
+            self.errors += 1
+            first = self.errors == 1
+        if first:
+            print(f"⚠️ {self.name}: {action} failed: {e}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Bytes untuk key atau None (miss/kedaluwarsa/error)"""
+        now = time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, accessed FROM entries WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, now),
+            ).fetchone()
+            if row is not None and (row[1] or 0) < now - _TOUCH_INTERVAL:
+                conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            self._error("get", e)
+            row = None
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0]
+
+    def contains(self, key: str) -> bool:
+        """True jika key ada & belum kedaluwarsa (tanpa membaca value, tanpa statistik)"""
+        try:
+            row = self._connect().execute(
+                "SELECT 1 FROM entries WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._error("contains", e)
+            return False
+        return row is not None
+
+    def put(self, key: str, value: bytes, ttl: Any = _DEFAULT_TTL):
+        """
+        Simpan bytes untuk key
+
+        Args:
+            ttl: Umur entri (detik); None = tidak kedaluwarsa; default ttl_seconds
+        """
+        if len(value) > self.max_bytes:
+            return
+        ttl = self.ttl_seconds if ttl is _DEFAULT_TTL else ttl
+        now = time.time()
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, stored, expires, accessed)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), now, None if ttl is None else now + ttl, now),
+            )
+        except sqlite3.Error as e:
+            self._error("put", e)
+            return
+        with self._lock:
+            self.writes += 1
+            self.puts_since_trim += 1
+            trim = self.puts_since_trim >= _TRIM_EVERY
+            if trim:
+                self.puts_since_trim = 0
+        if trim:
+            self.trim()
+
+    def trim(self):
+        """Hapus entri kedaluwarsa, lalu entri paling lama tidak dibaca sampai di bawah max_bytes"""
+        try:
+            conn = self._connect()
+            conn.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            excess, cutoff = total - self.max_bytes, None
+            for accessed, size in conn.execute("SELECT accessed, size FROM entries ORDER BY accessed"):
+                excess -= size
+                cutoff = accessed
+                if excess <= 0:
+                    break
+            conn.execute("DELETE FROM entries WHERE accessed <= ?", (cutoff,))
+        except sqlite3.Error as e:
+            self._error("trim", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik (hit/miss proses ini, isi tier bersama) untuk endpoint metrics"""
+        try:
+            entries, total = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        except sqlite3.Error:
+            entries = total = None
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "backend": self.backend,
+                "path": self.path,
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "errors": self.errors,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# ==============================================================================
+# BACKEND DISK (FILE PER ENTRI)
+# ==============================================================================
+
+class DiskSharedCache:
+    """
+    Key → bytes sebagai file {root}/{sha[:2]}/{sha} (untuk host tanpa SQLite
+    yang andal, mis. filesystem jaringan)
+
+    Kedaluwarsa dihitung dari mtime file; entri tanpa TTL disimpan dengan
+    akhiran .keep. Tulis atomik (tmp + replace). Tiap beberapa put, file
+    kedaluwarsa dan file tertua di atas max_bytes dihapus (FIFO menurut
+    waktu tulis: get tidak menyentuh mtime karena mtime = awal TTL).
+    """
+
+    backend = "disk"
+
+    def __init__(self, root: str, max_bytes: int, ttl_seconds: Optional[float], name: str = "shared_cache"):
+        self.name = name
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        self.puts_since_trim = 0
+
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, key: str, immortal: bool = False) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest + (".keep" if immortal else ""))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Bytes untuk key atau None (miss/kedaluwarsa)"""
+        value = None
+        for immortal in (False, True):
+            path = self._path(key, immortal)
+            try:
+                if not immortal and self.ttl_seconds is not None \
+                        and time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                    continue
+                with open(path, "rb") as f:
+                    value = f.read()
+                break
+            except OSError:
+                continue
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def contains(self, key: str) -> bool:
+        """True jika file key ada & belum kedaluwarsa (stat saja, tanpa statistik)"""
+        if os.path.exists(self._path(key, immortal=True)):
+            return True
+        try:
+            mtime = os.path.getmtime(self._path(key))
+        except OSError:
+            return False
+        return self.ttl_seconds is None or time.time() - mtime <= self.ttl_seconds
+
+    def put(self, key: str, value: bytes, ttl: Any = _DEFAULT_TTL):
+        """Simpan bytes untuk key (ttl=None: tidak kedaluwarsa)"""
+        if len(value) > self.max_bytes:
+            return
+        path = self._path(key, immortal=ttl is None)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            with self._lock:
+                self.errors += 1
+            print(f"⚠️ {self.name}: disk write failed: {e}")
+            return
+        with self._lock:
+            self.writes += 1
+            self.puts_since_trim += 1
+            trim = self.puts_since_trim >= _TRIM_EVERY
+            if trim:
+                self.puts_since_trim = 0
+        if trim:
+            self.trim()
+
+    def trim(self):
+        """Hapus file kedaluwarsa, lalu file tertua sampai di bawah max_bytes"""
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        cutoff = None if self.ttl_seconds is None else time.time() - self.ttl_seconds
+        for mtime, size, path in entries:
+            expired = cutoff is not None and mtime < cutoff and not path.endswith(".keep")
+            if not expired and total <= self.max_bytes:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik hit/miss proses ini untuk endpoint metrics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "backend": self.backend,
+                "path": self.root,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "errors": self.errors,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# ==============================================================================
+# FACTORY & DECORATOR
+# ==============================================================================
+
+def open_shared_cache(url: str, max_bytes: int, ttl_seconds: Optional[float],
+                      name: str = "shared_cache", base_dir: Optional[str] = None):
+    """
+    Buat backend dari URL konfigurasi
+
+    Args:
+        url: 'sqlite:///path/file.sqlite3', 'disk:///path/dir', atau
+            ''/'off' untuk menonaktifkan
+        max_bytes: Batas total ukuran
+        ttl_seconds: Umur default entri (None = tidak kedaluwarsa)
+        base_dir: Direktori acuan path relatif (default: direktori kerja)
+
+    Returns:
+        SQLiteSharedCache, DiskSharedCache, atau None
+    """
+    url = (url or "").strip()
+    if url.lower() in ("", "off", "none", "0"):
+        return None
+    scheme, sep, path = url.partition(":///")
+    if not sep:
+        raise ValueError(f"Shared cache URL harus berbentuk sqlite:///path atau disk:///path: {url!r}")
+    if base_dir and not os.path.isabs(path):
+        path = os.path.join(base_dir, path)
+    if scheme == "sqlite":
+        return SQLiteSharedCache(path, max_bytes, ttl_seconds, name)
+    if scheme == "disk":
+        return DiskSharedCache(path, max_bytes, ttl_seconds, name)
+    raise ValueError(f"Backend shared cache tidak dikenal: {scheme!r}")
+
+
+def shared_memoize(get_tier: Callable[[], Any], namespace: str, ttl: Any = None):
+    """
+    Decorator: hasil fungsi (picklable) disimpan di tier bersama
+
+    Dipasang di bawah lru_cache sehingga lru_cache = L1 per proses dan
+    tier ini = L2: miss L1 di worker dingin dibaca dari hasil worker lain
+    sebelum dihitung ulang.
+
+    Args:
+        get_tier: Callable yang mengembalikan backend aktif (atau None),
+            dievaluasi saat dipanggil sehingga tier bisa dikonfigurasi
+            setelah fungsi didefinisikan
+        namespace: Prefix key (sertakan versi bila hasil bisa berubah)
+        ttl: Umur entri (default None = tidak kedaluwarsa)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            tier = get_tier()
+            if tier is None:
+                return func(*args)
+            key = f"{namespace}:{args!r}"
+            data = tier.get(key)
+            if data is not None:
+                try:
+                    return pickle.loads(data)
+                except Exception:
+                    pass
+            value = func(*args)
+            tier.put(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ttl=ttl)
+            return value
+        return wrapper
+    return decorator
+
+
+startup_log("✅ Shared cache module loaded")
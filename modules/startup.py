@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+#==============================================================================
+#                    AnthroHPK v4.0 - STARTUP LOG MODULE
+#          Log Langkah Import/Startup + Waktu Sejak Awal Proses
+#==============================================================================
+
+Pengganti print "✅ ... loaded" saat import: setiap langkah dicatat dengan
+waktu sejak awal import (dibaca /api/metrics → startup & benchmarks/startup.py)
+dan hanya dicetak bila STARTUP_VERBOSE=1. Peringatan/error tetap memakai print.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+STARTUP_VERBOSE = os.environ.get("STARTUP_VERBOSE", "0").strip().lower() in ("1", "true", "yes")
+
+# Titik nol: modul ini diimpor paling awal (lewat config.py)
+_STARTED = time.perf_counter()
+_EVENTS: List[Tuple[float, str]] = []
+_LOCK = threading.Lock()
+
+
+def startup_log(message: str):
+    """
+    Catat satu langkah startup (dicetak hanya bila STARTUP_VERBOSE=1)
+
+    Args:
+        message: Teks langkah, mis. "✅ Cache module loaded"
+    """
+    elapsed = time.perf_counter() - _STARTED
+    with _LOCK:
+        _EVENTS.append((elapsed, message))
+    if STARTUP_VERBOSE:
+        print(message)
+
+
+def startup_report() -> Dict[str, Any]:
+    """Langkah startup & detik sejak awal import, untuk endpoint metrics"""
+    with _LOCK:
+        events = list(_EVENTS)
+    return {
+        "verbose": STARTUP_VERBOSE,
+        "elapsed_s": round(events[-1][0], 3) if events else 0.0,
+        "events": [{"t_s": round(t, 3), "message": message} for t, message in events],
+    }
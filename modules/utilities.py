@@ -12,13 +12,14 @@ import random
 from datetime import datetime, date
 from typing import Optional, Any, Tuple, List
 from functools import lru_cache
-from scipy.special import erf
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import MOTIVATIONAL_QUOTES, BOUNDS
+from config import MOTIVATIONAL_QUOTES, BOUNDS, AGE_MONTHS_MAX
+
+from modules.startup import startup_log
 
 # ==============================================================================
 # TYPE CONVERSION UTILITIES
@@ -219,7 +220,7 @@ def z_to_percentile(z_score: Optional[float]) -> Optional[float]:
         
         # Standard normal cumulative distribution function
         # Φ(z) = 0.5 * (1 + erf(z/√2))
-        percentile = 0.5 * (1.0 + erf(z / math.sqrt(2.0))) * 100.0
+        percentile = 0.5 * (1.0 + math.erf(z / math.sqrt(2.0))) * 100.0
         
         return round(percentile, 1)
     except Exception:
@@ -325,16 +326,20 @@ def validate_anthropometry(age_mo: Optional[float],
     errors = []
     warnings = []
     
-    # Age validation
+    # Age validation (non-finite/terlalu besar ditolak sebelum konversi ke hari)
     if age_mo is not None:
-        if age_mo < 0:
+        if not math.isfinite(age_mo) or age_mo > AGE_MONTHS_MAX:
+            errors.append(f"❌ Usia di luar rentang yang didukung (0-{AGE_MONTHS_MAX} bulan)")
+        elif age_mo < 0:
             errors.append("❌ Usia tidak boleh negatif")
         elif age_mo > 60:
             warnings.append("ℹ️ Aplikasi dioptimalkan untuk usia 0-60 bulan (WHO standards)")
     
-    # Weight validation (WHO plausibility ranges)
+    # Weight validation (WHO plausibility ranges); NaN gagal semua perbandingan → cek isfinite
     if weight is not None:
-        if weight < 1.0 or weight > 30.0:
+        if not math.isfinite(weight):
+            errors.append("❌ Berat badan harus berupa angka valid")
+        elif weight < 1.0 or weight > 30.0:
             errors.append(f"❌ Berat badan {weight:.1f} kg di luar rentang plausibel (1-30 kg)")
         elif weight < 2.0:
             warnings.append(f"⚠️ Berat badan {weight:.1f} kg sangat rendah - verifikasi ulang pengukuran")
@@ -343,7 +348,9 @@ def validate_anthropometry(age_mo: Optional[float],
     
     # Height validation (WHO plausibility ranges)
     if height is not None:
-        if height < 35 or height > 130:
+        if not math.isfinite(height):
+            errors.append("❌ Panjang/tinggi badan harus berupa angka valid")
+        elif height < 35 or height > 130:
             errors.append(f"❌ Panjang/tinggi {height:.1f} cm di luar rentang plausibel (35-130 cm)")
         elif height < 45:
             warnings.append(f"⚠️ Panjang/tinggi {height:.1f} cm sangat pendek - verifikasi pengukuran")
@@ -352,7 +359,9 @@ def validate_anthropometry(age_mo: Optional[float],
     
     # Head circumference validation (WHO standards)
     if head_circ is not None:
-        if head_circ < 20 or head_circ > 60:
+        if not math.isfinite(head_circ):
+            errors.append("❌ Lingkar kepala harus berupa angka valid")
+        elif head_circ < 20 or head_circ > 60:
             errors.append(f"❌ Lingkar kepala {head_circ:.1f} cm di luar rentang plausibel (20-60 cm)")
         elif head_circ < 30:
             warnings.append(f"⚠️ Lingkar kepala {head_circ:.1f} cm sangat kecil - konsultasi dokter anak")
@@ -413,4 +422,4 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
     return max(min_val, min(max_val, value))
 
 
-print("✅ Utilities module loaded")
+startup_log("✅ Utilities module loaded")
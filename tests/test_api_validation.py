@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Input non-finite (NaN/inf) & usia di luar rentang harus dijawab 422 yang
+bisa di-serialize, bukan 500, di /api/analyze dan validate_anthropometry.
+
+RUN: python -m pytest -q tests/
+"""
+
+import contextlib
+import io
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("fastapi")
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import api
+    from modules.utilities import validate_anthropometry
+
+from fastapi.testclient import TestClient
+
+client = TestClient(api.app, raise_server_exceptions=False)
+
+
+def _post_raw(url: str, body: str):
+    # json.dumps menolak NaN dengan allow_nan=False, jadi body ditulis manual
+    return client.post(url, content=body, headers={"content-type": "application/json"})
+
+
+@pytest.mark.parametrize("field", ["age_months", "weight", "height", "head_circ"])
+@pytest.mark.parametrize("value", ["NaN", "Infinity", "-Infinity"])
+def test_analyze_rejects_non_finite(field, value):
+    body = {"sex": '"M"', "age_months": "12", "weight": "9", "height": "75", "head_circ": "45"}
+    body[field] = value
+    response = _post_raw("/api/analyze", "{" + ", ".join(f'"{k}": {v}' for k, v in body.items()) + "}")
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", field]
+
+
+@pytest.mark.parametrize("age", ["1e308", "-1", "241"])
+def test_analyze_rejects_out_of_range_age(age):
+    response = _post_raw("/api/analyze", f'{{"sex": "M", "age_months": {age}, "weight": 9, "height": 75}}')
+    assert response.status_code == 422
+
+
+def test_analyze_rejects_age_from_dates_out_of_range():
+    response = _post_raw("/api/analyze",
+                         '{"sex": "M", "dob": "1900-01-01", "dom": "2024-01-01", "weight": 9, "height": 75}')
+    assert response.status_code == 422
+
+
+def test_analyze_valid_input():
+    response = _post_raw("/api/analyze", '{"sex": "M", "age_months": 12, "weight": 9, "height": 75}')
+    assert response.status_code == 200
+    assert response.json()["z"]["waz"] == -0.63
+
+
+def test_kejar_tumbuh_rejects_non_finite():
+    response = _post_raw("/api/kejar-tumbuh/analyze",
+                         '{"gender": "Laki-laki", "data": [{"usia_bulan": NaN, "bb": 7.2, "tb": 66}]}')
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("age, weight, height, head_circ", [
+    (math.nan, 9.0, 75.0, None),
+    (math.inf, 9.0, 75.0, None),
+    (12.0, math.nan, 75.0, None),
+    (12.0, 9.0, math.inf, None),
+    (12.0, 9.0, 75.0, math.nan),
+])
+def test_validate_anthropometry_rejects_non_finite(age, weight, height, head_circ):
+    errors, _ = validate_anthropometry(age, weight, height, head_circ)
+    assert errors
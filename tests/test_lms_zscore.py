@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+lms_zscore (fast path float) harus identik dengan pygrowup (Decimal) untuk
+setiap indeks, jenis kelamin & tabel WHO, termasuk batas usia/tinggi tabel
+dan z-score ekstrem (±5 SD).
+
+RUN: python -m pytest -q tests/
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from modules import anthropometry as anthro
+
+pytestmark = pytest.mark.skipif(anthro.calc is None, reason="pygrowup Calculator tidak tersedia")
+
+SEXES = ("M", "F")
+SD_LEVELS = (-5, -3, -2, -1, 0, 1, 2, 3, 5)
+
+# Usia (bulan) di sekitar batas tabel: 13 minggu (0_13 → 0_5), 24 bulan
+# (bmifa 0_2 → 2_5) dan 60 bulan (akhir tabel)
+BOUNDARY_AGES = (0, 0.5, 2.98, 2.9897, 2.99, 3.0, 3.01, 12, 23.99, 24, 24.01, 36.5, 59.99, 60, 60.01, 61)
+
+# Panjang/tinggi (cm) di sekitar batas tabel BB/PB: 45, koreksi 0.7 cm
+# (65.7), pergantian tabel BB/PB → BB/TB (86) dan akhir tabel (120, 120.7)
+BOUNDARY_HEIGHTS = (44.9, 45, 45.2, 65.7, 65.8, 66.4, 85.9, 86, 86.1, 86.5, 110, 119.9, 120, 120.2, 120.7, 121)
+
+# Pengukuran tipikal per indeks, untuk memastikan juga nilai di luar tabel
+TYPICAL = {'wfa': (2.5, 9.0, 16.0), 'lhfa': (50.0, 75.0, 105.0), 'bmifa': (12.0, 16.0, 20.0),
+           'hcfa': (34.0, 45.0, 50.0), 'wfl': (3.0, 10.0, 20.0)}
+
+_PYGROWUP = {
+    'wfa': anthro.calc.wfa if anthro.calc else None,
+    'lhfa': anthro.calc.lhfa if anthro.calc else None,
+    'wfl': anthro.calc.wfl if anthro.calc else None,
+    'bmifa': anthro.calc.bmifa if anthro.calc else None,
+    'hcfa': anthro.calc.hcfa if anthro.calc else None,
+}
+
+
+def _measurement_at_sd(indicator: str, sd: float, age_months: float, sex: str, height=None):
+    """Pengukuran (dibulatkan 0.01) dengan z-score ≈ sd menurut baris LMS tabel"""
+    lookup = anthro.lms_table_key(indicator, age_months, sex, height)
+    row = anthro._lms_row(*lookup) if lookup else None
+    if row is None:
+        return None
+    box_cox, median, cv = row
+    base = 1 + box_cox * cv * sd
+    if base <= 0:
+        return None
+    y = median * base ** (1 / box_cox)
+    if indicator == 'wfl' and 65.7 < y < 120.7:
+        y += 0.7
+    return round(y, 2)
+
+
+def _assert_same(indicator: str, measurement: float, age_months: float, sex: str, height=None):
+    expected = anthro._safe_z_calc(_PYGROWUP[indicator], measurement, age_months, sex, height)
+    actual = anthro.lms_zscore(indicator, measurement, age_months, sex, height)
+    assert actual == expected, (
+        f"{indicator} sex={sex} age={age_months} height={height} y={measurement}: "
+        f"lms_zscore={actual} pygrowup={expected}"
+    )
+
+
+@pytest.mark.parametrize("sex", SEXES)
+@pytest.mark.parametrize("age_months", BOUNDARY_AGES)
+@pytest.mark.parametrize("indicator", ("wfa", "lhfa", "bmifa", "hcfa"))
+def test_age_indicators_match_pygrowup(indicator, age_months, sex):
+    measurements = list(TYPICAL[indicator])
+    for sd in SD_LEVELS:
+        y = _measurement_at_sd(indicator, sd, age_months, sex)
+        if y is not None:
+            measurements.append(y)
+    for y in measurements:
+        _assert_same(indicator, y, age_months, sex)
+
+
+@pytest.mark.parametrize("sex", SEXES)
+@pytest.mark.parametrize("height", BOUNDARY_HEIGHTS)
+def test_weight_for_length_matches_pygrowup(height, sex):
+    for age_months in (6, 30):
+        measurements = list(TYPICAL['wfl'])
+        for sd in SD_LEVELS:
+            y = _measurement_at_sd('wfl', sd, age_months, sex, height)
+            if y is not None:
+                measurements.append(y)
+        for y in measurements:
+            _assert_same('wfl', y, age_months, sex, height)
+
+
+@pytest.mark.parametrize("sex", SEXES)
+def test_every_table_is_exercised(sex):
+    """Batas usia/tinggi di atas mencakup semua tabel WHO yang dipakai fast path"""
+    tables = {anthro.lms_table_key(ind, age, sex)[0]
+              for ind in ("wfa", "lhfa", "bmifa", "hcfa") for age in BOUNDARY_AGES
+              if anthro.lms_table_key(ind, age, sex)}
+    tables |= {anthro.lms_table_key('wfl', 12, sex, height)[0]
+               for height in BOUNDARY_HEIGHTS if anthro.lms_table_key('wfl', 12, sex, height)}
+    sex_name = anthro._LMS_SEX_TABLE[sex]
+    expected = {f"{ind}_{sex_name}_{part}" for ind in ("wfa", "lhfa", "hcfa") for part in ("0_13", "0_5")}
+    expected |= {f"bmifa_{sex_name}_{part}" for part in ("0_13", "0_2", "2_5")}
+    expected |= {f"wfl_{sex_name}_0_2", f"wfh_{sex_name}_2_5"}
+    assert tables == expected
+
+
+@pytest.mark.parametrize("measurement", (None, 0, -1.0))
+def test_invalid_measurement_returns_none(measurement):
+    assert anthro.lms_zscore('wfa', measurement, 12, "M") is None